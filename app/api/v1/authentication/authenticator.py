@@ -1,32 +1,28 @@
-import re
+import asyncio
 
-from inspect import Parameter, Signature
-from typing import Callable, Optional, cast, TYPE_CHECKING
+from typing import Annotated, Any, Callable, Optional, cast, TYPE_CHECKING
 
-from fastapi import Depends, HTTPException, status
-
-from makefun import with_signature
+from fastapi import Cookie, Depends, HTTPException, status
 
 from app.api.v1.managers import get_user_manager
 from app.api.v1.authentication.backend import auth_backend
 
 from app.core.config import settings
+from app.core.models import User
 
 if TYPE_CHECKING:
     from app.api.v1.managers import UserManager
 
-    from app.core.models import User
-
-
-INVALID_CHARS_PATTERN = re.compile(r"[^0-9a-zA-Z_]")
-INVALID_LEADING_CHARS_PATTERN = re.compile(r"^[^a-zA-Z_]+")
-
 
-def name_to_variable_name(name: str, prefix: str) -> str:
-    """Transform a backend name string into a string safe to use as variable name."""
-    name = re.sub(INVALID_CHARS_PATTERN, "", name)
-    name = re.sub(INVALID_LEADING_CHARS_PATTERN, "", name)
-    return f"{prefix}_{name}"
+def get_refresh_token(
+    refresh_token: Annotated[
+        Optional[str], Cookie(alias=settings.AUTH.REFRESH_TOKEN)
+    ] = None,
+) -> Optional[str]:
+    """
+    Dependency callable to retrieve the refresh token from its cookie.
+    """
+    return refresh_token
 
 
 class Authenticator:
@@ -37,6 +33,8 @@ class Authenticator:
     If the backend does not return a user, an HTTPException is thrown.
     """
 
+    __slots__ = ()
+
     def get_current_user_token(
         self,
         required_token_type: str,
@@ -48,18 +46,25 @@ class Authenticator:
         """
         Return a dependency callable to retrieve currently authenticated user and token.
         """
-        signature = self._get_dependency_signature()
-
-        @with_signature(signature)
-        async def current_user_token_dependency(*args, **kwargs):
+        # Only declare the token source that is actually needed,
+        # access tokens come from the bearer header, refresh tokens from the cookie.
+        if required_token_type == settings.AUTH.ACCESS_TOKEN:
+            get_token = cast(Callable, auth_backend.transport.scheme)
+        else:
+            get_token = get_refresh_token
+
+        async def current_user_token_dependency(
+            user_manager: Annotated["UserManager", Depends(get_user_manager)],
+            token: Annotated[Optional[str], Depends(get_token)],
+        ):
             return await self._authenticate(
-                *args,
+                user_manager=user_manager,
+                token=token,
                 token_type=required_token_type,
                 optional=optional,
                 active=active,
                 verified=verified,
                 superuser=superuser,
-                **kwargs,
             )
 
         return current_user_token_dependency
@@ -85,41 +90,96 @@ class Authenticator:
         :param superuser: If `True`, throw `403 Forbidden` if
         the authenticated user is not a superuser. Defaults to `False`.
         """
-        signature = self._get_dependency_signature()
+        current_user_token_dependency = self.get_current_user_token(
+            required_token_type=settings.AUTH.ACCESS_TOKEN,
+            optional=optional,
+            active=active,
+            verified=verified,
+            superuser=superuser,
+        )
 
-        @with_signature(signature)
-        async def current_user_dependency(*args, **kwargs):
-            user, _ = await self._authenticate(
-                *args,
-                token_type=settings.AUTH.ACCESS_TOKEN,
-                optional=optional,
+        async def current_user_dependency(
+            user_token: Annotated[
+                tuple[Optional[User], tuple[Optional[str], Optional[int]]],
+                Depends(current_user_token_dependency),
+            ],
+        ):
+            return user_token[0]
+
+        return current_user_dependency
+
+    def get_current_user_tokens(
+        self,
+        active: bool = True,
+        verified: bool = True,
+        superuser: bool = False,
+    ):
+        """
+        Return a dependency callable to retrieve currently authenticated user
+        with both its access and refresh tokens.
+
+        The access token is required, the refresh token is only returned
+        if it is valid and was issued to the same user, `(None, None)` otherwise.
+        Both tokens are decoded concurrently and the user is fetched once.
+        """
+
+        async def current_user_tokens_dependency(
+            user_manager: Annotated["UserManager", Depends(get_user_manager)],
+            access_token: Annotated[
+                Optional[str], Depends(cast(Callable, auth_backend.transport.scheme))
+            ],
+            refresh_token: Annotated[Optional[str], Depends(get_refresh_token)],
+        ):
+            access_claims, refresh_claims = await asyncio.gather(
+                self._read_claims(access_token, settings.AUTH.ACCESS_TOKEN),
+                self._read_claims(refresh_token, settings.AUTH.REFRESH_TOKEN),
+            )
+
+            user: Optional[User] = None
+
+            if access_claims is not None:
+                user = await auth_backend.strategy.get_token_user(
+                    access_claims, user_manager
+                )
+
+            user = self._check_user(
+                user,
+                optional=False,
                 active=active,
                 verified=verified,
                 superuser=superuser,
-                **kwargs,
             )
-            return user
 
-        return current_user_dependency
+            refresh_token_info: tuple[Optional[str], Optional[int]] = (None, None)
+
+            if (
+                refresh_claims is not None
+                and refresh_claims["sub"] == access_claims["sub"]
+            ):
+                refresh_token_info = (refresh_token, refresh_claims.get("exp"))
+
+            return (
+                user,
+                (access_token, access_claims.get("exp")),
+                refresh_token_info,
+            )
+
+        return current_user_tokens_dependency
 
     async def _authenticate(  # noqa
         self,
-        *args,  # noqa
         user_manager: "UserManager",
+        token: Optional[str],
         token_type: str,
         optional: bool,
         active: bool,
         verified: bool,
         superuser: bool,
-        **kwargs,
     ) -> tuple[
-        Optional["User"],
+        Optional[User],
         tuple[Optional[str], Optional[int]],
     ]:
-        user: Optional["User"] = None
-        token: Optional[str] = kwargs.get(
-            name_to_variable_name(name=auth_backend.name, prefix=token_type)
-        )
+        user: Optional[User] = None
         token_exp: Optional[int] = None
 
         if token is not None:
@@ -129,6 +189,31 @@ class Authenticator:
                 required_token_type=token_type,
             )
 
+        user = self._check_user(
+            user,
+            optional=optional,
+            active=active,
+            verified=verified,
+            superuser=superuser,
+        )
+
+        return user, (token, token_exp)
+
+    @staticmethod
+    def _check_user(
+        user: Optional[User],
+        optional: bool,
+        active: bool,
+        verified: bool,
+        superuser: bool,
+    ) -> Optional[User]:
+        """
+        Check the user has the required flags.
+
+        :raises HTTPException: There is no user or it doesn't pass the requirements,
+        and the user is not optional.
+        :return: The user, or None if the user is optional and missing or rejected.
+        """
         status_code = status.HTTP_401_UNAUTHORIZED
 
         if user is not None:
@@ -143,38 +228,16 @@ class Authenticator:
         if not user and not optional:
             raise HTTPException(status_code=status_code)
 
-        return user, (token, token_exp)
+        return user
 
-    def _get_dependency_signature(self) -> Signature:  # noqa
-        """
-        Generate a dynamic signature for the get_current_user dependency.
+    @staticmethod
+    async def _read_claims(
+        token: Optional[str], token_type: str
+    ) -> Optional[dict[str, Any]]:
+        if token is None:
+            return None
 
-        This method is redundant for the current API version,
-        but I'll keep it for future compatibility.
-        """
-        parameters: list[Parameter] = [
-            Parameter(
-                name="user_manager",
-                kind=Parameter.POSITIONAL_OR_KEYWORD,
-                default=Depends(get_user_manager),
-            ),
-            Parameter(
-                name=name_to_variable_name(
-                    name=auth_backend.name, prefix=settings.AUTH.ACCESS_TOKEN
-                ),
-                kind=Parameter.POSITIONAL_OR_KEYWORD,
-                default=Depends(cast(Callable, auth_backend.transport.scheme)),
-            ),
-            Parameter(
-                name=name_to_variable_name(
-                    name=auth_backend.name, prefix=settings.AUTH.REFRESH_TOKEN
-                ),
-                kind=Parameter.POSITIONAL_OR_KEYWORD,
-                default=Depends(auth_backend.transport.get_cookie),
-            ),
-        ]
-
-        return Signature(parameters)
+        return await auth_backend.strategy.read_token_claims(token, token_type)
 
 
 authenticator = Authenticator()
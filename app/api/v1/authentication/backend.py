@@ -1,3 +1,5 @@
+import asyncio
+
 from typing import TYPE_CHECKING, Optional
 
 from app.api.v1.authentication.jwt_bearer import JWTStrategy, BearerTransport
@@ -17,6 +19,8 @@ class AuthenticationBackend:
     Together, they provide a full authentication method logic.
     """
 
+    __slots__ = ("name", "transport", "strategy")
+
     def __init__(self):
         self.name = settings.AUTH.JWT.BACKEND_NAME
         self.transport = BearerTransport()
@@ -30,15 +34,19 @@ class AuthenticationBackend:
         :param is_refresh: A flag indicating whether this is a token refresh operation.
         :return: A response containing the access token, and optionally the refresh token.
         """
-        access_token = await self.strategy.write_token(
-            user=user, token_type=settings.AUTH.ACCESS_TOKEN
-        )
-
         if is_refresh:
+            access_token = await self.strategy.write_token(
+                user=user, token_type=settings.AUTH.ACCESS_TOKEN
+            )
             return await self.transport.get_login_response(access_token)
         else:
-            refresh_token = await self.strategy.write_token(
-                user=user, token_type=settings.AUTH.REFRESH_TOKEN
+            access_token, refresh_token = await asyncio.gather(
+                self.strategy.write_token(
+                    user=user, token_type=settings.AUTH.ACCESS_TOKEN
+                ),
+                self.strategy.write_token(
+                    user=user, token_type=settings.AUTH.REFRESH_TOKEN
+                ),
             )
             return await self.transport.get_login_response(access_token, refresh_token)
 
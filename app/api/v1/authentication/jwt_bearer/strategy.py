@@ -1,32 +1,83 @@
-import jwt
+import os
+import time
+import asyncio
+import hashlib
+import multiprocessing
 
-from typing import Optional, TYPE_CHECKING
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Optional, TYPE_CHECKING
 
-from app.api.v1.utils import decode_jwt, generate_jwt
+from cachetools import TLRUCache
+
+from app.api.v1.utils import (
+    decode_jwt,
+    generate_jwt_from_pem,
+    load_public_key,
+    JWTError,
+)
 from app.api.v1.managers.db import token_blacklist_manager
 
 from app.core.config import settings
+from app.core.utils import Symbol
 from app.core.exceptions import (
     UserNotExists,
     InvalidID,
 )
 
 if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric.types import PublicKeyTypes
+
     from app.api.v1.managers import UserManager
 
     from app.core.models import User
 
 
+NOT_CACHED = Symbol("NOT_CACHED")
+
+
 class JWTStrategy:
+    __slots__ = (
+        "private_key_pem",
+        "public_key",
+        "lifetime_seconds",
+        "token_audience",
+        "algorithm",
+        "max_token_length",
+        "decode_cache_ttl",
+        "decoded_tokens",
+        "signing_workers",
+        "_signing_pool",
+        # The close method is connected to app_lifecycle through a weak reference.
+        "__weakref__",
+    )
+
     def __init__(self):
-        self.private_key: str = settings.AUTH.JWT.PRIVATE_KEY.read_text()
-        self.public_key: str = settings.AUTH.JWT.PUBLIC_KEY.read_text()
+        # The private key is sent to the signing processes, which parse it once.
+        self.private_key_pem: bytes = settings.AUTH.JWT.PRIVATE_KEY_BYTES
+        # Parse the public key once instead of letting PyJWT parse the PEM on every call.
+        self.public_key: "PublicKeyTypes" = load_public_key(
+            settings.AUTH.JWT.PUBLIC_KEY_BYTES
+        )
         self.lifetime_seconds: dict[str, int] = {
             settings.AUTH.ACCESS_TOKEN: settings.AUTH.JWT.ACCESS_TOKEN_LIFETIME_SECONDS,
             settings.AUTH.REFRESH_TOKEN: settings.AUTH.JWT.REFRESH_TOKEN_LIFETIME_SECONDS,
         }
         self.token_audience: str = settings.AUTH.JWT.TOKEN_AUDIENCE
         self.algorithm: str = settings.AUTH.JWT.ALGORITHM
+        self.max_token_length: int = settings.AUTH.JWT.MAX_TOKEN_LENGTH
+        self.decode_cache_ttl: int = settings.AUTH.JWT.DECODE_CACHE_TTL_SECONDS
+        # Decoded claims keyed by a digest of the token, None for tokens that failed
+        # to decode. Entries expire with the token at the latest.
+        self.decoded_tokens: TLRUCache[bytes, Optional[dict[str, Any]]] = TLRUCache(
+            maxsize=settings.AUTH.JWT.DECODE_CACHE_MAXSIZE,
+            ttu=self._get_cache_expiration,
+            timer=time.time,
+        )
+        self.signing_workers: int = (
+            settings.AUTH.JWT.SIGNING_WORKERS or os.cpu_count() or 1
+        )
+        self._signing_pool: Optional[ProcessPoolExecutor] = None
 
     async def read_token(
         self,
@@ -34,33 +85,83 @@ class JWTStrategy:
         user_manager: "UserManager",
         required_token_type: str = settings.AUTH.ACCESS_TOKEN,
     ) -> tuple[Optional["User"], Optional[int]]:
-        if await token_blacklist_manager.is_blacklisted(token=token, db_idx=0):
+        data = await self.read_token_claims(token, required_token_type)
+
+        if data is None:
             return None, None
 
-        try:
-            data = decode_jwt(
-                encoded_jwt=token,
-                public_key=self.public_key,
-                audience=self.token_audience,
-                algorithms=[self.algorithm],
+        user = await self.get_token_user(data, user_manager)
+
+        if user is None:
+            return None, None
+
+        return user, data.get("exp")
+
+    async def read_token_claims(
+        self,
+        token: str,
+        required_token_type: str = settings.AUTH.ACCESS_TOKEN,
+    ) -> Optional[dict[str, Any]]:
+        """
+        Get the claims of a valid, not blacklisted token of the required type.
+
+        :param token: The encoded token.
+        :param required_token_type: The type the token must have.
+        :return: The token claims, or None if the token can't be used.
+        """
+        # A JWS has exactly three segments, reject garbage before any lookup.
+        if len(token) > self.max_token_length or token.count(".") != 2:
+            return None
+
+        cache_key = self._make_cache_key(token)
+        data = self.decoded_tokens.get(cache_key, NOT_CACHED)
+
+        if data is NOT_CACHED:
+            # The blacklist lookup is I/O bound and the signature verification
+            # is CPU bound, so run the latter in a thread while waiting for Redis.
+            loop = asyncio.get_running_loop()
+            blacklisted, data = await asyncio.gather(
+                token_blacklist_manager.is_blacklisted(token=token, db_idx=0),
+                loop.run_in_executor(None, self._decode_token, token),
+            )
+            self.decoded_tokens[cache_key] = data
+        elif data is None:
+            # Known to be invalid, no need to ask Redis.
+            return None
+        else:
+            blacklisted = await token_blacklist_manager.is_blacklisted(
+                token=token, db_idx=0
             )
 
-            user_id = data.get("sub")
-            token_type = data.get(settings.AUTH.TOKEN_TYPE)
+        if blacklisted or data is None:
+            return None
 
-            if user_id is None or token_type is None:
-                return None, None
+        user_id = data.get("sub")
+        token_type = data.get(settings.AUTH.TOKEN_TYPE)
 
-            if token_type != required_token_type:
-                return None, None
-        except jwt.PyJWTError:
-            return None, None
+        if user_id is None or token_type is None:
+            return None
+
+        if token_type != required_token_type:
+            return None
+
+        return data
 
+    async def get_token_user(  # noqa
+        self, data: dict[str, Any], user_manager: "UserManager"
+    ) -> Optional["User"]:
+        """
+        Get the user the token was issued to.
+
+        :param data: The token claims, as returned by read_token_claims.
+        :param user_manager: The user manager instance.
+        :return: The user, or None if it doesn't exist.
+        """
         try:
-            parsed_id = user_manager.parse_id(user_id)
-            return await user_manager.get(parsed_id), data.get("exp")
+            parsed_id = user_manager.parse_id(data["sub"])
+            return await user_manager.get(parsed_id)
         except (UserNotExists, InvalidID):
-            return None, None
+            return None
 
     async def write_token(self, user: "User", token_type: str) -> str:
         data = {
@@ -68,12 +169,36 @@ class JWTStrategy:
             settings.AUTH.TOKEN_TYPE: token_type,
         }
 
-        return generate_jwt(
-            data=data,
-            private_key=self.private_key,
-            audience=self.token_audience,
-            lifetime_seconds=self.lifetime_seconds[token_type],
-            algorithm=self.algorithm,
+        return await self._sign(data, token_type)
+
+    async def warmup(self) -> None:
+        """
+        Start the signing processes and sign a token in each of them, so that
+        the first logins pay neither for the startup nor for parsing the key.
+        """
+        data = {"sub": "warmup", settings.AUTH.TOKEN_TYPE: settings.AUTH.ACCESS_TOKEN}
+
+        await asyncio.gather(
+            *[
+                self._sign(data, settings.AUTH.ACCESS_TOKEN)
+                for _ in range(self.signing_workers)
+            ]
+        )
+
+    async def _sign(self, data: dict[str, Any], token_type: str) -> str:
+        # Signing is CPU bound, run it in another process to use all the cores.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_signing_pool(),
+            partial(
+                generate_jwt_from_pem,
+                data=data,
+                private_key_pem=self.private_key_pem,
+                audience=self.token_audience,
+                lifetime_seconds=self.lifetime_seconds[token_type],
+                algorithm=self.algorithm,
+                library=settings.AUTH.JWT.LIBRARY,
+            ),
         )
 
     async def destroy_token(  # noqa
@@ -82,18 +207,74 @@ class JWTStrategy:
         access_token_info: tuple[str, int],
         refresh_token_info: tuple[Optional[str], Optional[int]],
     ) -> None:
+        tokens_info = [access_token_info]
 
-        await token_blacklist_manager.set(
-            token=access_token_info[0],
-            user_id=user_id,
-            ex=access_token_info[1],
+        if refresh_token_info[0] is not None:
+            tokens_info.append(refresh_token_info)
+
+        for token, _ in tokens_info:
+            self.decoded_tokens.pop(self._make_cache_key(token), None)
+
+        await token_blacklist_manager.set_many(
+            [(token, user_id, exp) for token, exp in tokens_info],
             db_idx=0,
         )
 
-        if refresh_token_info[0] is not None:
-            await token_blacklist_manager.set(
-                token=refresh_token_info[0],
-                user_id=user_id,
-                ex=refresh_token_info[1],
-                db_idx=0,
-            ),
+    async def close(self, **kwargs):  # noqa
+        """
+        Shut down the signing processes.
+        """
+        if self._signing_pool is not None:
+            pool, self._signing_pool = self._signing_pool, None
+            await asyncio.to_thread(pool.shutdown)
+
+    def _get_signing_pool(self) -> ProcessPoolExecutor:
+        if self._signing_pool is None:
+            # Forking a process already running threads (the default executor,
+            # the password hashing one) may deadlock the children, start them
+            # from a clean server process instead.
+            self._signing_pool = ProcessPoolExecutor(
+                max_workers=self.signing_workers,
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+
+        return self._signing_pool
+
+    def _get_cache_expiration(
+        self, _key: bytes, data: Optional[dict[str, Any]], now: float
+    ) -> float:
+        """
+        Compute when a decoded token has to be evicted from the cache.
+
+        :param _key: The cache key of the token.
+        :param data: The token claims, or None if the token is invalid.
+        :param now: The current time.
+        :return: The time the entry expires, no later than the token itself.
+        """
+        expiration = now + self.decode_cache_ttl
+
+        if data is not None and data.get("exp") is not None:
+            expiration = min(expiration, data["exp"])
+
+        return expiration
+
+    @staticmethod
+    def _make_cache_key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def _decode_token(self, token: str) -> Optional[dict[str, Any]]:
+        """
+        Decode the token.
+
+        :param token: The encoded token.
+        :return: The token claims, or None if the token is invalid or expired.
+        """
+        try:
+            return decode_jwt(
+                encoded_jwt=token,
+                public_key=self.public_key,
+                audience=self.token_audience,
+                algorithms=[self.algorithm],
+            )
+        except JWTError:
+            return None
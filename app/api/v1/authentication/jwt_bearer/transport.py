@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING, Literal, Optional
 
-from fastapi import status, Response, Request
-from fastapi.responses import JSONResponse
+from fastapi import status, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer
 
 from app.core.schemas import BearerTokenSchema
@@ -11,6 +11,29 @@ if TYPE_CHECKING:
     from app.core.types import OpenAPIResponseType
 
 
+OPENAPI_LOGIN_RESPONSES_SUCCESS: "OpenAPIResponseType" = {
+    status.HTTP_200_OK: {
+        "model": BearerTokenSchema,
+        "content": {
+            "application/json": {
+                "example": {
+                    "access_token": "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9.eyJ1"
+                    "c2VyX2lkIjoiOTIyMWZmYzktNjQwZi00MzcyLTg2Z"
+                    "DMtY2U2NDJjYmE1NjAzIiwiYXVkIjoiZmFzdGFwaS"
+                    "11c2VyczphdXRoIiwiZXhwIjoxNTcxNTA0MTkzfQ."
+                    "M10bjOe45I5Ncu_uXvOmVV8QxnL-nZfcH96U90JaocI",
+                    "token_type": "bearer",
+                }
+            }
+        },
+    },
+}
+
+OPENAPI_LOGOUT_RESPONSES_SUCCESS: "OpenAPIResponseType" = {
+    status.HTTP_204_NO_CONTENT: {"model": None}
+}
+
+
 class BearerTransport:
     """
     A class to handle authentication processes using Bearer tokens.
@@ -19,6 +42,17 @@ class BearerTransport:
     and provides schemas for OpenAPI documentation.
     """
 
+    __slots__ = (
+        "rt_cookie_name",
+        "rt_cookie_max_age",
+        "rt_cookie_path",
+        "rt_cookie_domain",
+        "rt_cookie_secure",
+        "rt_cookie_httponly",
+        "rt_cookie_samesite",
+        "scheme",
+    )
+
     def __init__(self):
         self.rt_cookie_name = settings.AUTH.REFRESH_TOKEN
         self.rt_cookie_max_age = settings.AUTH.JWT.REFRESH_TOKEN_LIFETIME_SECONDS
@@ -47,9 +81,10 @@ class BearerTransport:
         :return: A JSON response containing the access token, and optionally setting the refresh token as a cookie.
         """
 
-        bearer_token = BearerTokenSchema(access_token=access_token, token_type="bearer")
-        response = JSONResponse(
-            content=bearer_token.model_dump(), status_code=status.HTTP_200_OK
+        # The payload matches BearerTokenSchema, no need to validate it.
+        response = ORJSONResponse(
+            content={"access_token": access_token, "token_type": "bearer"},
+            status_code=status.HTTP_200_OK,
         )
 
         if refresh_token:
@@ -105,9 +140,6 @@ class BearerTransport:
 
         return response
 
-    async def get_cookie(self, request: Request) -> Optional[str]:
-        return request.cookies.get(self.rt_cookie_name)
-
     @staticmethod
     def get_openapi_login_responses_success() -> "OpenAPIResponseType":
         """
@@ -116,23 +148,7 @@ class BearerTransport:
         :return: A dictionary representing the OpenAPI schema for a successful login response.
         """
 
-        return {
-            status.HTTP_200_OK: {
-                "model": BearerTokenSchema,
-                "content": {
-                    "application/json": {
-                        "example": {
-                            "access_token": "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9.eyJ1"
-                            "c2VyX2lkIjoiOTIyMWZmYzktNjQwZi00MzcyLTg2Z"
-                            "DMtY2U2NDJjYmE1NjAzIiwiYXVkIjoiZmFzdGFwaS"
-                            "11c2VyczphdXRoIiwiZXhwIjoxNTcxNTA0MTkzfQ."
-                            "M10bjOe45I5Ncu_uXvOmVV8QxnL-nZfcH96U90JaocI",
-                            "token_type": "bearer",
-                        }
-                    }
-                },
-            },
-        }
+        return OPENAPI_LOGIN_RESPONSES_SUCCESS
 
     @staticmethod
     def get_openapi_logout_responses_success() -> "OpenAPIResponseType":
@@ -141,4 +157,4 @@ class BearerTransport:
 
         :return: A dictionary representing the OpenAPI schema for a successful logout response.
         """
-        return {status.HTTP_204_NO_CONTENT: {"model": None}}
+        return OPENAPI_LOGOUT_RESPONSES_SUCCESS
@@ -1,15 +1,29 @@
+import asyncio
+
+from app.api.v1.authentication.backend import auth_backend
 from app.api.v1.managers.db import token_blacklist_manager
 
 from app.core.signals import app_lifecycle
 
 
 async def on_startup():
-    await app_lifecycle.connect(
+    await asyncio.gather(
+        token_blacklist_manager.warmup(),
+        auth_backend.strategy.warmup(),
+    )
+
+    app_lifecycle.connect(
         receiver=token_blacklist_manager.close,
         sender=token_blacklist_manager.__class__,
         dispatch_uid="token_blacklist_manager_close",
     )
+    app_lifecycle.connect(
+        receiver=auth_backend.strategy.close,
+        sender=auth_backend.strategy.__class__,
+        dispatch_uid="jwt_strategy_close",
+    )
 
 
 async def on_shutdown():
     await app_lifecycle.send(sender=token_blacklist_manager.__class__)
+    await app_lifecycle.send(sender=auth_backend.strategy.__class__)
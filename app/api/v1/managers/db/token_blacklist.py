@@ -1,7 +1,12 @@
+import asyncio
+import hashlib
+
 from typing import Any
 
+from cachetools import TTLCache
+
 from app.core.db.redis.client import RedisClient
-from app.core.utils import cached_property
+from app.core.db.redis.batching import KeyExistsBatcher
 from app.core.config import settings
 
 
@@ -12,10 +17,35 @@ class RedisTokenBlacklistManager:
 
     :param params: Dictionary containing the configuration parameters for the manager.
                    - key_prefix: A prefix for keys in Redis (default is "user").
+                   - negative_cache_size: Maximum number of keys known not to be
+                     blacklisted kept in memory (default is 50000).
+                   - negative_cache_ttl: Time in seconds a key is known not to be
+                     blacklisted before Redis is asked again (default is 30).
+                   - batch_delay: Time in seconds concurrent lookups are collected
+                     before being sent to Redis together (default is 0.001).
+                   - batch_max_size: Number of collected lookups that are sent
+                     to Redis right away (default is 100).
+                   - check_legacy_keys: Whether the raw token keys used before the
+                     keys were digested are also checked (default is True).
                    - options: Additional options to configure the Redis client.
     :type params: dict[str, Any]
     """
 
+    __slots__ = (
+        "key_prefix",
+        "_key_start",
+        "_options",
+        "_cache",
+        "_not_blacklisted",
+        "_recently_blacklisted",
+        "_batch_delay",
+        "_batch_max_size",
+        "_batchers",
+        "_check_legacy_keys",
+        # The close method is connected to app_lifecycle through a weak reference.
+        "__weakref__",
+    )
+
     def __init__(self, params: dict[str, Any]):
         """
         Initializes the RedisTokenBlacklistManager with the given parameters.
@@ -24,18 +54,46 @@ class RedisTokenBlacklistManager:
         :type params: dict[str, Any]
         """
         self.key_prefix = params.get("key_prefix", "user")
+        self._key_start = f"{self.key_prefix}:"
         self._options = params.get("options", {})
+        # Creating the client does not connect, the pools are opened on first use.
+        self._cache = RedisClient(servers=self._get_server_urls(), **self._options)
+        # Keys recently found missing in Redis. Blacklisting through this manager
+        # evicts the key, other processes are only seen once the entry expires.
+        self._not_blacklisted: TTLCache[tuple[int, str], bool] = TTLCache(
+            maxsize=params.get("negative_cache_size", 50_000),
+            ttl=params.get("negative_cache_ttl", 30),
+        )
+        # Keys blacklisted through this manager lately. A lookup racing with the
+        # blacklisting may still read the key as missing, such a result must not
+        # be cached.
+        self._recently_blacklisted: TTLCache[tuple[int, str], bool] = TTLCache(
+            maxsize=params.get("negative_cache_size", 50_000),
+            ttl=params.get("negative_cache_ttl", 30),
+        )
+        self._batch_delay = params.get("batch_delay", 0.001)
+        self._batch_max_size = params.get("batch_max_size", 100)
+        self._batchers: dict[int, KeyExistsBatcher] = {}
+        # Tokens blacklisted before the keys were digested are stored under the raw
+        # token. They stay in Redis until they expire, i.e. for a refresh token
+        # lifetime at most after the upgrade, after which this can be turned off.
+        self._check_legacy_keys = params.get("check_legacy_keys", True)
 
     def _make_key(self, token: str) -> str:
         """
-        Constructs a Redis key by combining the key prefix and the token.
+        Constructs a Redis key by combining the key prefix and a digest of the token.
+
+        Tokens can be kilobytes long, the 128-bit BLAKE2b digest keeps keys short.
 
         :param token: The token to create a key for.
         :type token: str
         :return: The constructed Redis key.
         :rtype: str
         """
-        return f"{self.key_prefix}:{token}"
+        return (
+            self._key_start
+            + hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+        )
 
     def _get_server_urls(self) -> dict[int, str]:  # noqa
         """
@@ -53,15 +111,24 @@ class RedisTokenBlacklistManager:
 
         return server_urls
 
-    @cached_property
-    def _cache(self):
+    def _get_batcher(self, db_idx: int) -> KeyExistsBatcher:
         """
-        Lazily initializes and caches the Redis client instance used for token blacklisting.
+        Returns the batcher coalescing the blacklist lookups of the given database.
 
-        :return: The Redis client instance.
-        :rtype: RedisClient
+        :param db_idx: The index of the Redis database.
+        :type db_idx: int
+        :return: The batcher for the database.
+        :rtype: KeyExistsBatcher
         """
-        return RedisClient(servers=self._get_server_urls(), **self._options)
+        if db_idx not in self._batchers:
+            self._batchers[db_idx] = KeyExistsBatcher(
+                client=self._cache,
+                db_idx=db_idx,
+                delay=self._batch_delay,
+                max_batch_size=self._batch_max_size,
+            )
+
+        return self._batchers[db_idx]
 
     async def is_blacklisted(
         self,
@@ -79,7 +146,26 @@ class RedisTokenBlacklistManager:
         :rtype: bool
         """
         key = self._make_key(token)
-        return await self._cache.has_key(key, db_idx)
+
+        if (db_idx, key) in self._not_blacklisted:
+            return False
+
+        batcher = self._get_batcher(db_idx)
+
+        if self._check_legacy_keys:
+            # Both keys are checked in the same batch.
+            blacklisted = any(
+                await asyncio.gather(
+                    batcher.exists(key), batcher.exists(self._key_start + token)
+                )
+            )
+        else:
+            blacklisted = await batcher.exists(key)
+
+        if not blacklisted and (db_idx, key) not in self._recently_blacklisted:
+            self._not_blacklisted[db_idx, key] = True
+
+        return blacklisted
 
     async def set(
         self,
@@ -102,8 +188,34 @@ class RedisTokenBlacklistManager:
         :return: None
         """
         key = self._make_key(token)
+        self._recently_blacklisted[db_idx, key] = True
+        self._not_blacklisted.pop((db_idx, key), None)
         await self._cache.set(key, user_id, ex, db_idx=db_idx)
 
+    async def set_many(
+        self,
+        items: list[tuple[str, int, int]],
+        db_idx: int = 0,
+    ) -> None:
+        """
+        Adds several tokens to the blacklist in a single round trip.
+
+        :param items: (token, user_id, ex) tuples describing the tokens to blacklist.
+        :type items: list[tuple[str, int, int]]
+        :param db_idx: The index of the Redis database to store the tokens in (default is 0).
+        :type db_idx: int
+        :return: None
+        """
+        keyed_items = [
+            (self._make_key(token), user_id, ex) for token, user_id, ex in items
+        ]
+
+        for key, _, _ in keyed_items:
+            self._recently_blacklisted[db_idx, key] = True
+            self._not_blacklisted.pop((db_idx, key), None)
+
+        await self._cache.set_many(keyed_items, db_idx=db_idx)
+
     async def clear(self, db_idx: int = 0) -> bool:
         """
         Clears all blacklisted tokens from the specified Redis database.
@@ -115,6 +227,17 @@ class RedisTokenBlacklistManager:
         """
         return await self._cache.clear(db_idx)
 
+    async def warmup(self) -> None:
+        """
+        Creates the Redis client and opens a connection to each blacklist database,
+        so that the first requests do not pay for the connection setup.
+
+        :return: None
+        """
+        await asyncio.gather(
+            *[self._cache.ping(db_idx) for db_idx in settings.REDIS.TOKEN_BLACKLIST_DB]
+        )
+
     async def close(self, **kwargs):  # noqa
         """
         Closes the Redis client connection.
@@ -1,14 +1,14 @@
-from typing import TYPE_CHECKING, Optional, Any
+from typing import TYPE_CHECKING, Iterable, Optional, Any
 
 from fastapi import Depends
 
-from sqlalchemy import select, func
+from sqlalchemy import select, insert, update, func, lambda_stmt
 
 from app.core.models import User
 from app.core.db import adapter
 
 if TYPE_CHECKING:
-    from sqlalchemy import Select
+    from sqlalchemy import StatementLambdaElement
     from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -21,37 +21,56 @@ class UserDatabaseManager:
         self.session = session
 
     async def get(self, user_id: int) -> Optional[User]:
-        statement = select(User).where(User.id == user_id)
+        # Lambda statements are built and cached once, only the parameters vary.
+        statement = lambda_stmt(lambda: select(User).where(User.id == user_id))
         return await self._get_user(statement)
 
+    async def get_many(self, user_ids: Iterable[int]) -> list[User]:
+        # One IN query instead of a round trip per id, missing ids are skipped.
+        user_ids = list(user_ids)
+
+        if not user_ids:
+            return []
+
+        statement = lambda_stmt(lambda: select(User).where(User.id.in_(user_ids)))
+        results = await self.session.execute(statement)
+        return list(results.scalars().all())
+
     async def get_by_email(self, email: str) -> Optional[User]:
-        statement = select(User).where(
-            func.lower(User.email) == func.lower(email)  # type: ignore
+        # Lowercase the parameter here, so the lookup matches ix_users_email_lower.
+        email = email.lower()
+        statement = lambda_stmt(
+            lambda: select(User).where(func.lower(User.email) == email)
         )
         return await self._get_user(statement)
 
     async def create(self, create_dict: dict[str, Any]) -> User:
-        user = User(**create_dict)
-        self.session.add(user)
+        # RETURNING loads the new row in the same round trip, no refresh needed.
+        statement = insert(User).values(**create_dict).returning(User)
+        result = await self.session.execute(statement)
+        user = result.scalar_one()
         await self.session.commit()
-        await self.session.refresh(user)
         return user
 
     async def update(self, user: User, update_dict: dict[str, Any]) -> User:
-        for key, value in update_dict.items():
-            setattr(user, key, value)
-        self.session.add(user)
+        if not update_dict:
+            return user
+
+        statement = (
+            update(User).where(User.id == user.id).values(**update_dict).returning(User)
+        )
+        result = await self.session.execute(statement)
+        user = result.scalar_one()
         await self.session.commit()
-        await self.session.refresh(user)
         return user
 
     async def delete(self, user: User) -> None:
         await self.session.delete(user)
         await self.session.commit()
 
-    async def _get_user(self, statement: "Select") -> Optional[User]:
+    async def _get_user(self, statement: "StatementLambdaElement") -> Optional[User]:
         results = await self.session.execute(statement)
-        return results.unique().scalar_one_or_none()
+        return results.scalar_one_or_none()
 
 
 async def get_user_db_manager(
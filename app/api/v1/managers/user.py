@@ -1,8 +1,10 @@
-from typing import Any, TYPE_CHECKING, Optional
+import secrets
+
+from typing import Any, Iterable, TYPE_CHECKING, Optional
 
 from fastapi import Depends
 
-from app.api.v1.utils import PasswordHelper
+from app.api.v1.utils import password_helper
 from app.api.v1.managers.db import get_user_db_manager
 
 from app.core.types import DependencyCallable
@@ -21,6 +23,11 @@ if TYPE_CHECKING:
     from app.core.schemas import UserCreateSchema, UserUpdateSchema
 
 
+# Verified against when there is no real hash to check, so that rejected logins
+# cost as much as a wrong password.
+DUMMY_PASSWORD_HASH = password_helper.hash(secrets.token_urlsafe())
+
+
 class UserManager:
     """
     User management logic.
@@ -33,7 +40,7 @@ class UserManager:
 
     def __init__(self, user_db: "UserDatabaseManager"):
         self.user_db = user_db
-        self.password_helper = PasswordHelper()
+        self.password_helper = password_helper
 
     # noinspection PyMethodMayBeStatic
     def parse_id(self, value: Any) -> int:
@@ -66,6 +73,17 @@ class UserManager:
 
         return user
 
+    async def get_many(self, user_ids: Iterable[int]) -> dict[int, "User"]:
+        """
+        Get several users by id in a single query.
+
+        :param user_ids: Identifiers of the users to retrieve.
+        :return: The users that exist, keyed by id.
+        """
+        users = await self.user_db.get_many(user_ids)
+
+        return {user.id: user for user in users}
+
     async def get_by_email(self, email: str) -> "User":
         """
         Get a user by e-mail.
@@ -108,7 +126,7 @@ class UserManager:
             else user_create.create_update_dict_superuser()
         )
         password = user_dict.pop("password")
-        user_dict["hashed_password"] = self.password_helper.hash(password)
+        user_dict["hashed_password"] = await self.password_helper.ahash(password)
 
         created_user = await self.user_db.create(user_dict)
 
@@ -268,10 +286,16 @@ class UserManager:
         try:
             user = await self.get_by_email(credentials.username)
         except UserNotExists:
-            self.password_helper.hash(credentials.password)
+            user = None
+
+        # Inactive users can't log in whatever the password, don't check the real one.
+        if user is None or not user.is_active:
+            await self.password_helper.averify_and_update(
+                credentials.password, DUMMY_PASSWORD_HASH
+            )
             return None
 
-        verified, updated_password_hash = self.password_helper.verify_and_update(
+        verified, updated_password_hash = await self.password_helper.averify_and_update(
             credentials.password, user.hashed_password
         )
 
@@ -296,8 +320,8 @@ class UserManager:
                     validated_update_dict["is_verified"] = False
             elif field == "password" and value is not None:
                 self.password_helper.validate_password(value)
-                validated_update_dict["hashed_password"] = self.password_helper.hash(
-                    value
+                validated_update_dict["hashed_password"] = (
+                    await self.password_helper.ahash(value)
                 )
             else:
                 validated_update_dict[field] = value
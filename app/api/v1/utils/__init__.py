@@ -1,12 +1,24 @@
 __all__ = [
     "PasswordHelper",
+    "password_helper",
     "generate_jwt",
+    "generate_jwt_from_pem",
     "decode_jwt",
+    "load_private_key",
+    "load_public_key",
+    "JWTError",
     "generate_verification_code",
     "generate_reset_password_token",
 ]
 
 
-from .pwd_helper import PasswordHelper
-from .jwt_generator import generate_jwt, decode_jwt
+from .pwd_helper import PasswordHelper, password_helper
+from .jwt_generator import (
+    generate_jwt,
+    generate_jwt_from_pem,
+    decode_jwt,
+    load_private_key,
+    load_public_key,
+    JWTError,
+)
 from .security import generate_verification_code, generate_reset_password_token
@@ -1,29 +1,67 @@
-import jwt
+import importlib
 
-from datetime import datetime, timedelta, timezone
-from typing import Any
+from functools import lru_cache
+from typing import Any, TYPE_CHECKING
+
+from cryptography.hazmat.primitives.serialization import load_pem_public_key
+
+from app.core.config import settings
+
+# The signing functions live outside of app.api, the signing processes import
+# them without the rest of the application.
+from app.core.utils.jwt_signing import (
+    get_jwt_api,
+    generate_jwt as _generate_jwt,
+    generate_jwt_from_pem,
+    load_private_key,
+)
+
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric.types import (
+        PrivateKeyTypes,
+        PublicKeyTypes,
+    )
+
+
+# Any module exposing PyJWT's encode/decode API and exceptions can be used.
+jwt = importlib.import_module(settings.AUTH.JWT.LIBRARY)
+
+JWTError: type[Exception] = jwt.PyJWTError
+
+jwt_api = get_jwt_api(settings.AUTH.JWT.LIBRARY)
 
 
 def generate_jwt(
     data: dict[str, Any],
-    private_key: str,
+    private_key: "str | PrivateKeyTypes",
     audience: str,
     lifetime_seconds: int,
     algorithm: str,
 ) -> str:
-    payload = data.copy()
-
-    expire = datetime.now(timezone.utc) + timedelta(seconds=lifetime_seconds)
+    return _generate_jwt(
+        data=data,
+        private_key=private_key,
+        audience=audience,
+        lifetime_seconds=lifetime_seconds,
+        algorithm=algorithm,
+        library=settings.AUTH.JWT.LIBRARY,
+    )
 
-    payload["exp"] = expire
-    payload["aud"] = audience
 
-    return jwt.encode(payload=payload, key=private_key, algorithm=algorithm)
+@lru_cache(maxsize=8)
+def load_public_key(public_key_pem: bytes) -> "PublicKeyTypes":
+    """
+    Parse a PEM encoded public key, the result is cached.
+    """
+    return load_pem_public_key(public_key_pem)
 
 
 def decode_jwt(
-    encoded_jwt: str, public_key: str, audience: str, algorithms: list[str]
+    encoded_jwt: str,
+    public_key: "str | PublicKeyTypes",
+    audience: str,
+    algorithms: list[str],
 ) -> dict[str, Any]:
-    return jwt.decode(
+    return jwt_api.decode(
         jwt=encoded_jwt, key=public_key, algorithms=algorithms, audience=audience
     )
@@ -1,3 +1,7 @@
+import os
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union
 from string import (
     punctuation,
@@ -11,21 +15,52 @@ from pwdlib import PasswordHash
 from pwdlib.hashers.argon2 import Argon2Hasher
 from pwdlib.hashers.bcrypt import BcryptHasher
 
+from app.core.config import settings
 from app.core.exceptions import InvalidPasswordException
 
 
-VALID_CHARS = {"-", "_", ".", "!", "@", "#", "$", "^", "&", "(", ")"}
-INVALID_CHARS = set(punctuation + whitespace) - VALID_CHARS
+VALID_CHARS = frozenset({"-", "_", ".", "!", "@", "#", "$", "^", "&", "(", ")"})
+INVALID_CHARS = frozenset(punctuation + whitespace) - VALID_CHARS
+
+
+def _ascii_bytes_except(chars: frozenset[str] | str) -> bytes:
+    """
+    Return all the ASCII bytes but the given characters, to be used as the `delete`
+    argument of `bytes.translate`, which then keeps only the given characters.
+    """
+    return bytes(byte for byte in range(128) if chr(byte) not in chars)
+
+
+# Only ASCII characters can be invalid, other characters are dropped when encoding.
+ALLOWED_BYTES = _ascii_bytes_except(INVALID_CHARS)
+NON_DIGIT_BYTES = _ascii_bytes_except(digits)
+NON_LOWERCASE_BYTES = _ascii_bytes_except(ascii_lowercase)
+NON_UPPERCASE_BYTES = _ascii_bytes_except(ascii_uppercase)
+
+_PASSWORD_HASH = PasswordHash(
+    (
+        Argon2Hasher(
+            time_cost=settings.AUTH.PASSWORD.ARGON2_TIME_COST,
+            memory_cost=settings.AUTH.PASSWORD.ARGON2_MEMORY_COST,
+            parallelism=settings.AUTH.PASSWORD.ARGON2_PARALLELISM,
+        ),
+        BcryptHasher(),
+    )
+)
+
+# Argon2 releases the GIL, so hashing in threads runs in parallel. The semaphore
+# keeps the excess requests waiting on the event loop, where they can still be
+# cancelled, instead of piling up in the executor queue.
+_HASHING_WORKERS = settings.AUTH.PASSWORD.HASHING_WORKERS or os.cpu_count() or 1
+_HASHING_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_HASHING_WORKERS, thread_name_prefix="password-hashing"
+)
+_HASHING_SEMAPHORE = asyncio.Semaphore(_HASHING_WORKERS)
 
 
 class PasswordHelper:
     def __init__(self):
-        self.password_hash = PasswordHash(
-            (
-                Argon2Hasher(),
-                BcryptHasher(),
-            )
-        )
+        self.password_hash = _PASSWORD_HASH
 
     def verify_and_update(
         self, plain_password: str, hashed_password: str
@@ -49,6 +84,37 @@ class PasswordHelper:
         """
         return self.password_hash.hash(password)
 
+    async def averify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, Union[str, None]]:
+        """
+        Same as `verify_and_update`, but runs in a thread to keep the event loop free.
+
+        :param plain_password: The password to be checked.
+        :param hashed_password: The hash to be verified.
+        :return: A tuple containing a boolean indicating if the password matches the hash,
+        and an updated hash if the current hasher or the hash itself needs to be updated.
+        """
+        async with _HASHING_SEMAPHORE:
+            return await asyncio.get_running_loop().run_in_executor(
+                _HASHING_EXECUTOR,
+                self.verify_and_update,
+                plain_password,
+                hashed_password,
+            )
+
+    async def ahash(self, password: str) -> str:
+        """
+        Same as `hash`, but runs in a thread to keep the event loop free.
+
+        :param password: The password to be hashed.
+        :return: The hashed password.
+        """
+        async with _HASHING_SEMAPHORE:
+            return await asyncio.get_running_loop().run_in_executor(
+                _HASHING_EXECUTOR, self.hash, password
+            )
+
     # noinspection PyMethodMayBeStatic
     def validate_password(self, password: str) -> None:
         """
@@ -59,7 +125,8 @@ class PasswordHelper:
         :return: None if the password is valid.
         """
 
-        if len(password.strip()) != len(password):
+        # Slicing avoids an IndexError on an empty password, rejected by length below.
+        if password[:1].isspace() or password[-1:].isspace():
             raise InvalidPasswordException(
                 "Password should not contain leading or trailing spaces."
             )
@@ -69,23 +136,21 @@ class PasswordHelper:
                 "Password length must be between 5 and 20 characters."
             )
 
-        has_digit = False
-        has_lowercase = False
-        has_uppercase = False
-
-        for char in password:
-            if char in INVALID_CHARS:
-                raise InvalidPasswordException("Password contains invalid characters.")
-            if char in digits:
-                has_digit = True
-            if char in ascii_lowercase:
-                has_lowercase = True
-            if char in ascii_uppercase:
-                has_uppercase = True
-
-        if not (has_digit and has_lowercase and has_uppercase):
+        encoded = password.encode("ascii", "ignore")
+
+        if encoded.translate(None, ALLOWED_BYTES):
+            raise InvalidPasswordException("Password contains invalid characters.")
+
+        if not (
+            encoded.translate(None, NON_DIGIT_BYTES)
+            and encoded.translate(None, NON_LOWERCASE_BYTES)
+            and encoded.translate(None, NON_UPPERCASE_BYTES)
+        ):
             raise InvalidPasswordException(
                 "Password must contain at least one digit, one lowercase letter, and one uppercase letter."
             )
 
         return None
+
+
+password_helper = PasswordHelper()
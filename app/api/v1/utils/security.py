@@ -2,7 +2,8 @@ import secrets
 
 
 def generate_verification_code() -> int:
-    return secrets.randbelow(900_000) + 100_000
+    # A single read of 32 random bits, the modulo bias is below 0.03%.
+    return int.from_bytes(secrets.token_bytes(4), "big") % 900_000 + 100_000
 
 
 def generate_reset_password_token() -> str:
@@ -16,6 +16,39 @@ if TYPE_CHECKING:
     from app.core.types import OpenAPIResponseType
 
 
+LOGIN_RESPONSES: "OpenAPIResponseType" = {
+    status.HTTP_400_BAD_REQUEST: {
+        "model": ErrorModel,
+        "content": {
+            "application/json": {
+                "examples": {
+                    ErrorCode.LOGIN_BAD_CREDENTIALS: {
+                        "summary": "Bad credentials or the user is inactive.",
+                        "value": {"detail": ErrorCode.LOGIN_BAD_CREDENTIALS},
+                    },
+                    ErrorCode.LOGIN_USER_NOT_VERIFIED: {
+                        "summary": "The user is not verified.",
+                        "value": {"detail": ErrorCode.LOGIN_USER_NOT_VERIFIED},
+                    },
+                }
+            }
+        },
+    },
+    **auth_backend.transport.get_openapi_login_responses_success(),
+}
+
+LOGOUT_RESPONSES: "OpenAPIResponseType" = {
+    status.HTTP_401_UNAUTHORIZED: {"description": "Missing token or inactive user."},
+    **auth_backend.transport.get_openapi_logout_responses_success(),
+}
+
+REFRESH_RESPONSES: "OpenAPIResponseType" = {
+    status.HTTP_401_UNAUTHORIZED: {"description": "The refresh token is missed."},
+    status.HTTP_403_FORBIDDEN: {"description": "The user is not verified."},
+    **auth_backend.transport.get_openapi_login_responses_success(),
+}
+
+
 def get_auth_router(
     get_user_manager: "UserManagerDependency",
     authenticator: "Authenticator",
@@ -28,13 +61,7 @@ def get_auth_router(
         tags=["Auth"],
     )
 
-    get_current_active_user_access_token = authenticator.get_current_user_token(
-        required_token_type=settings.AUTH.ACCESS_TOKEN,
-        verified=requires_verification,
-    )
-    get_current_user_refresh_token = authenticator.get_current_user_token(
-        required_token_type=settings.AUTH.REFRESH_TOKEN,
-        optional=True,
+    get_current_active_user_tokens = authenticator.get_current_user_tokens(
         verified=requires_verification,
     )
     get_current_active_user_refresh_token = authenticator.get_current_user_token(
@@ -42,50 +69,10 @@ def get_auth_router(
         verified=requires_verification,
     )
 
-    login_responses: "OpenAPIResponseType" = {
-        status.HTTP_400_BAD_REQUEST: {
-            "model": ErrorModel,
-            "content": {
-                "application/json": {
-                    "examples": {
-                        ErrorCode.LOGIN_BAD_CREDENTIALS: {
-                            "summary": "Bad credentials or the user is inactive.",
-                            "value": {"detail": ErrorCode.LOGIN_BAD_CREDENTIALS},
-                        },
-                        ErrorCode.LOGIN_USER_NOT_VERIFIED: {
-                            "summary": "The user is not verified.",
-                            "value": {"detail": ErrorCode.LOGIN_USER_NOT_VERIFIED},
-                        },
-                    }
-                }
-            },
-        },
-        **auth_backend.transport.get_openapi_login_responses_success(),
-    }
-
-    logout_responses: "OpenAPIResponseType" = {
-        **{
-            status.HTTP_401_UNAUTHORIZED: {
-                "description": "Missing token or inactive user."
-            }
-        },
-        **auth_backend.transport.get_openapi_logout_responses_success(),
-    }
-
-    refresh_responses: "OpenAPIResponseType" = {
-        **{
-            status.HTTP_401_UNAUTHORIZED: {
-                "description": "The refresh token is missed."
-            },
-            status.HTTP_403_FORBIDDEN: {"description": "The user is not verified."},
-        },
-        **auth_backend.transport.get_openapi_login_responses_success(),
-    }
-
     @router.post(
         "/login",
         name=f"auth:{auth_backend.name}.login",
-        responses=login_responses,
+        responses=LOGIN_RESPONSES,
     )
     async def login(
         credentials: Annotated[OAuth2PasswordRequestForm, Depends()],
@@ -110,21 +97,19 @@ def get_auth_router(
     @router.post(
         "/logout",
         name=f"auth:{auth_backend.name}.logout",
-        responses=logout_responses,
+        responses=LOGOUT_RESPONSES,
     )
     async def logout(
-        access_token: Annotated[
-            tuple["User", tuple[str, int]],
-            Depends(get_current_active_user_access_token),
-        ],
-        refresh_token: Annotated[
-            tuple[Optional["User"], tuple[Optional[str], Optional[int]]],
-            Depends(get_current_user_refresh_token),
+        user_tokens: Annotated[
+            tuple[
+                "User",
+                tuple[str, int],
+                tuple[Optional[str], Optional[int]],
+            ],
+            Depends(get_current_active_user_tokens),
         ],
     ):
-        user = access_token[0]
-        access_token_info = access_token[1]
-        refresh_token_info = refresh_token[1]
+        user, access_token_info, refresh_token_info = user_tokens
 
         return await auth_backend.logout(
             user_id=user.id,
@@ -135,7 +120,7 @@ def get_auth_router(
     @router.post(
         "/refresh",
         name=f"auth:{auth_backend.name}.refresh",
-        responses=refresh_responses,
+        responses=REFRESH_RESPONSES,
     )
     async def refresh(
         refresh_token: Annotated[
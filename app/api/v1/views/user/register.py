@@ -17,6 +17,32 @@ if TYPE_CHECKING:
     from app.core.types import OpenAPIResponseType
 
 
+REGISTER_RESPONSES: "OpenAPIResponseType" = {
+    status.HTTP_400_BAD_REQUEST: {
+        "model": ErrorModel,
+        "content": {
+            "application/json": {
+                "examples": {
+                    ErrorCode.REGISTER_USER_ALREADY_EXISTS: {
+                        "summary": "A user with this email already exists.",
+                        "value": {"detail": ErrorCode.REGISTER_USER_ALREADY_EXISTS},
+                    },
+                    ErrorCode.REGISTER_INVALID_PASSWORD: {
+                        "summary": "Password validation failed.",
+                        "value": {
+                            "detail": {
+                                "code": ErrorCode.REGISTER_INVALID_PASSWORD,
+                                "reason": "Password should be at least 3 characters",
+                            }
+                        },
+                    },
+                }
+            }
+        },
+    },
+}
+
+
 def get_register_router(get_user_manager: "UserManagerDependency") -> APIRouter:
     """Generate a router with the register route."""
 
@@ -25,38 +51,12 @@ def get_register_router(get_user_manager: "UserManagerDependency") -> APIRouter:
         tags=["Register"],
     )
 
-    register_responses: "OpenAPIResponseType" = {
-        status.HTTP_400_BAD_REQUEST: {
-            "model": ErrorModel,
-            "content": {
-                "application/json": {
-                    "examples": {
-                        ErrorCode.REGISTER_USER_ALREADY_EXISTS: {
-                            "summary": "A user with this email already exists.",
-                            "value": {"detail": ErrorCode.REGISTER_USER_ALREADY_EXISTS},
-                        },
-                        ErrorCode.REGISTER_INVALID_PASSWORD: {
-                            "summary": "Password validation failed.",
-                            "value": {
-                                "detail": {
-                                    "code": ErrorCode.REGISTER_INVALID_PASSWORD,
-                                    "reason": "Password should be"
-                                    "at least 3 characters",
-                                }
-                            },
-                        },
-                    }
-                }
-            },
-        },
-    }
-
     @router.post(
         "/register",
         response_model=UserSchema,
         status_code=status.HTTP_201_CREATED,
         name="register:register",
-        responses=register_responses,
+        responses=REGISTER_RESPONSES,
     )
     async def register(
         user_create: UserCreateSchema,
@@ -2,8 +2,6 @@ from typing import TYPE_CHECKING, Annotated
 
 from fastapi import APIRouter, Body, Depends, HTTPException, status
 
-from pydantic import EmailStr
-
 from app.core.exceptions import (
     ErrorModel,
     ErrorCode,
@@ -13,6 +11,7 @@ from app.core.exceptions import (
     InvalidPasswordException,
 )
 from app.core.config import settings
+from app.core.types import NormalizedEmail
 
 if TYPE_CHECKING:
     from app.api.v1.managers import UserManager, UserManagerDependency
@@ -20,6 +19,32 @@ if TYPE_CHECKING:
     from app.core.types import OpenAPIResponseType
 
 
+RESET_PASSWORD_RESPONSES: "OpenAPIResponseType" = {
+    status.HTTP_400_BAD_REQUEST: {
+        "model": ErrorModel,
+        "content": {
+            "application/json": {
+                "examples": {
+                    ErrorCode.RESET_PASSWORD_BAD_TOKEN: {
+                        "summary": "Bad or expired token.",
+                        "value": {"detail": ErrorCode.RESET_PASSWORD_BAD_TOKEN},
+                    },
+                    ErrorCode.RESET_PASSWORD_INVALID_PASSWORD: {
+                        "summary": "Password validation failed.",
+                        "value": {
+                            "detail": {
+                                "code": ErrorCode.RESET_PASSWORD_INVALID_PASSWORD,
+                                "reason": "Password should be at least 3 characters",
+                            }
+                        },
+                    },
+                }
+            }
+        },
+    },
+}
+
+
 def get_reset_password_router(get_user_manager: "UserManagerDependency") -> APIRouter:
     """Generate a router with the reset password routes."""
 
@@ -28,31 +53,6 @@ def get_reset_password_router(get_user_manager: "UserManagerDependency") -> APIR
         tags=["Reset password"],
     )
 
-    reset_password_responses: "OpenAPIResponseType" = {
-        status.HTTP_400_BAD_REQUEST: {
-            "model": ErrorModel,
-            "content": {
-                "application/json": {
-                    "examples": {
-                        ErrorCode.RESET_PASSWORD_BAD_TOKEN: {
-                            "summary": "Bad or expired token.",
-                            "value": {"detail": ErrorCode.RESET_PASSWORD_BAD_TOKEN},
-                        },
-                        ErrorCode.RESET_PASSWORD_INVALID_PASSWORD: {
-                            "summary": "Password validation failed.",
-                            "value": {
-                                "detail": {
-                                    "code": ErrorCode.RESET_PASSWORD_INVALID_PASSWORD,
-                                    "reason": "Password should be at least 3 characters",
-                                }
-                            },
-                        },
-                    }
-                }
-            },
-        },
-    }
-
     @router.post(
         "/forgot-password",
         status_code=status.HTTP_202_ACCEPTED,
@@ -60,7 +60,7 @@ def get_reset_password_router(get_user_manager: "UserManagerDependency") -> APIR
     )
     async def forgot_password(
         user_manager: Annotated["UserManager", Depends(get_user_manager)],
-        email: EmailStr = Body(..., embed=True),
+        email: Annotated[NormalizedEmail, Body(embed=True)],
     ):
         try:
             user = await user_manager.get_by_email(email)
@@ -77,7 +77,7 @@ def get_reset_password_router(get_user_manager: "UserManagerDependency") -> APIR
     @router.post(
         "/reset-password",
         name="reset:reset_password",
-        responses=reset_password_responses,
+        responses=RESET_PASSWORD_RESPONSES,
     )
     async def reset_password(
         user_manager: Annotated["UserManager", Depends(get_user_manager)],
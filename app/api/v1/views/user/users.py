@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pydantic import TypeAdapter
 
 from app.core.exceptions import (
     UserNotExists,
@@ -21,6 +22,86 @@ if TYPE_CHECKING:
     from app.core.models import User
 
 
+# Built once for the module, the routes only run the validator.
+USER_SCHEMA_ADAPTER: TypeAdapter[UserSchema] = TypeAdapter(UserSchema)
+
+
+def get_user_response(user: "User") -> Response:
+    """
+    Serialize the user as the UserSchema JSON response.
+
+    Returning a Response skips FastAPI's own pass over the response model,
+    which would dump the validated schema and validate it a second time.
+    The routes still declare the response model for the OpenAPI schema.
+
+    :param user: The user to serialize.
+    :return: The JSON response.
+    """
+    schema = USER_SCHEMA_ADAPTER.validate_python(user, from_attributes=True)
+
+    return Response(
+        content=USER_SCHEMA_ADAPTER.dump_json(schema),
+        media_type="application/json",
+    )
+
+
+UNAUTHORIZED_RESPONSE: "OpenAPIResponseType" = {
+    status.HTTP_401_UNAUTHORIZED: {
+        "description": "Missing token or inactive user.",
+    },
+}
+FORBIDDEN_RESPONSE: "OpenAPIResponseType" = {
+    status.HTTP_403_FORBIDDEN: {
+        "description": "Not a superuser.",
+    },
+}
+NOT_FOUND_RESPONSE: "OpenAPIResponseType" = {
+    status.HTTP_404_NOT_FOUND: {
+        "description": "The user does not exist.",
+    },
+}
+UPDATE_USER_BAD_REQUEST_RESPONSE: "OpenAPIResponseType" = {
+    status.HTTP_400_BAD_REQUEST: {
+        "model": ErrorModel,
+        "content": {
+            "application/json": {
+                "examples": {
+                    ErrorCode.UPDATE_USER_EMAIL_ALREADY_EXISTS: {
+                        "summary": "A user with this email already exists.",
+                        "value": {"detail": ErrorCode.UPDATE_USER_EMAIL_ALREADY_EXISTS},
+                    },
+                    ErrorCode.UPDATE_USER_INVALID_PASSWORD: {
+                        "summary": "Password validation failed.",
+                        "value": {
+                            "detail": {
+                                "code": ErrorCode.UPDATE_USER_INVALID_PASSWORD,
+                                "reason": "Password should be at least 3 characters",
+                            }
+                        },
+                    },
+                }
+            }
+        },
+    },
+}
+
+ME_RESPONSES: "OpenAPIResponseType" = {**UNAUTHORIZED_RESPONSE}
+UPDATE_ME_RESPONSES: "OpenAPIResponseType" = {
+    **UNAUTHORIZED_RESPONSE,
+    **UPDATE_USER_BAD_REQUEST_RESPONSE,
+}
+GET_USER_RESPONSES: "OpenAPIResponseType" = {
+    **UNAUTHORIZED_RESPONSE,
+    **FORBIDDEN_RESPONSE,
+    **NOT_FOUND_RESPONSE,
+}
+UPDATE_USER_RESPONSES: "OpenAPIResponseType" = {
+    **GET_USER_RESPONSES,
+    **UPDATE_USER_BAD_REQUEST_RESPONSE,
+}
+DELETE_USER_RESPONSES: "OpenAPIResponseType" = {**GET_USER_RESPONSES}
+
+
 def get_users_router(
     get_user_manager: "UserManagerDependency",
     authenticator: "Authenticator",
@@ -33,104 +114,6 @@ def get_users_router(
         tags=["Users"],
     )
 
-    me_responses: "OpenAPIResponseType" = {
-        status.HTTP_401_UNAUTHORIZED: {
-            "description": "Missing token or inactive user.",
-        },
-    }
-
-    update_me_responses: "OpenAPIResponseType" = {
-        status.HTTP_401_UNAUTHORIZED: {
-            "description": "Missing token or inactive user.",
-        },
-        status.HTTP_400_BAD_REQUEST: {
-            "model": ErrorModel,
-            "content": {
-                "application/json": {
-                    "examples": {
-                        ErrorCode.UPDATE_USER_EMAIL_ALREADY_EXISTS: {
-                            "summary": "A user with this email already exists.",
-                            "value": {
-                                "detail": ErrorCode.UPDATE_USER_EMAIL_ALREADY_EXISTS
-                            },
-                        },
-                        ErrorCode.UPDATE_USER_INVALID_PASSWORD: {
-                            "summary": "Password validation failed.",
-                            "value": {
-                                "detail": {
-                                    "code": ErrorCode.UPDATE_USER_INVALID_PASSWORD,
-                                    "reason": "Password should be"
-                                    "at least 3 characters",
-                                }
-                            },
-                        },
-                    }
-                }
-            },
-        },
-    }
-
-    get_user_responses: "OpenAPIResponseType" = {
-        status.HTTP_401_UNAUTHORIZED: {
-            "description": "Missing token or inactive user.",
-        },
-        status.HTTP_403_FORBIDDEN: {
-            "description": "Not a superuser.",
-        },
-        status.HTTP_404_NOT_FOUND: {
-            "description": "The user does not exist.",
-        },
-    }
-
-    update_user_responses: "OpenAPIResponseType" = {
-        status.HTTP_401_UNAUTHORIZED: {
-            "description": "Missing token or inactive user.",
-        },
-        status.HTTP_403_FORBIDDEN: {
-            "description": "Not a superuser.",
-        },
-        status.HTTP_404_NOT_FOUND: {
-            "description": "The user does not exist.",
-        },
-        status.HTTP_400_BAD_REQUEST: {
-            "model": ErrorModel,
-            "content": {
-                "application/json": {
-                    "examples": {
-                        ErrorCode.UPDATE_USER_EMAIL_ALREADY_EXISTS: {
-                            "summary": "A user with this email already exists.",
-                            "value": {
-                                "detail": ErrorCode.UPDATE_USER_EMAIL_ALREADY_EXISTS
-                            },
-                        },
-                        ErrorCode.UPDATE_USER_INVALID_PASSWORD: {
-                            "summary": "Password validation failed.",
-                            "value": {
-                                "detail": {
-                                    "code": ErrorCode.UPDATE_USER_INVALID_PASSWORD,
-                                    "reason": "Password should be"
-                                    "at least 3 characters",
-                                }
-                            },
-                        },
-                    }
-                }
-            },
-        },
-    }
-
-    delete_user_responses: "OpenAPIResponseType" = {
-        status.HTTP_401_UNAUTHORIZED: {
-            "description": "Missing token or inactive user.",
-        },
-        status.HTTP_403_FORBIDDEN: {
-            "description": "Not a superuser.",
-        },
-        status.HTTP_404_NOT_FOUND: {
-            "description": "The user does not exist.",
-        },
-    }
-
     get_current_user = authenticator.get_current_user(
         verified=requires_verification,
     )
@@ -153,19 +136,19 @@ def get_users_router(
         "/me",
         response_model=UserSchema,
         name="users:current_user",
-        responses=me_responses,
+        responses=ME_RESPONSES,
     )
     async def me(
         user: Annotated["User", Depends(get_current_user)],
     ):
-        return UserSchema.model_validate(user)
+        return get_user_response(user)
 
     @router.patch(
         "/me",
         response_model=UserSchema,
         dependencies=[Depends(get_current_user)],
         name="users:patch_current_user",
-        responses=update_me_responses,
+        responses=UPDATE_ME_RESPONSES,
     )
     async def update_me(
         user_update: UserUpdateSchema,
@@ -174,7 +157,7 @@ def get_users_router(
     ):
         try:
             user = await user_manager.update(user_update, user, safe=True)
-            return UserSchema.model_validate(user)
+            return get_user_response(user)
         except InvalidPasswordException as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -194,19 +177,19 @@ def get_users_router(
         response_model=UserSchema,
         dependencies=[Depends(get_current_superuser)],
         name="users:user",
-        responses=get_user_responses,
+        responses=GET_USER_RESPONSES,
     )
     async def get_user(
         user: Annotated["User", Depends(get_user_or_404)],
     ):
-        return UserSchema.model_validate(user)
+        return get_user_response(user)
 
     @router.patch(
         "/{user_id}",
         response_model=UserSchema,
         dependencies=[Depends(get_current_superuser)],
         name="users:patch_user",
-        responses=update_user_responses,
+        responses=UPDATE_USER_RESPONSES,
     )
     async def update_user(
         user_update: UserUpdateSchema,
@@ -215,7 +198,7 @@ def get_users_router(
     ):
         try:
             user = await user_manager.update(user_update, user, safe=False)
-            return UserSchema.model_validate(user)
+            return get_user_response(user)
         except InvalidPasswordException as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -236,13 +219,13 @@ def get_users_router(
         response_class=Response,
         dependencies=[Depends(get_current_superuser)],
         name="users:delete_user",
-        responses=delete_user_responses,
+        responses=DELETE_USER_RESPONSES,
     )
     async def delete_user(
         user: Annotated["User", Depends(get_user_or_404)],
         user_manager: Annotated["UserManager", Depends(get_user_manager)],
     ):
         await user_manager.delete(user)
-        return None
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
 
     return router
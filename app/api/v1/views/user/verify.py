@@ -2,8 +2,6 @@ from typing import TYPE_CHECKING, Annotated
 
 from fastapi import APIRouter, Body, Depends, HTTPException, status
 
-from pydantic import EmailStr
-
 from app.core.exceptions import (
     UserAlreadyVerified,
     UserInactive,
@@ -13,6 +11,7 @@ from app.core.exceptions import (
     InvalidVerificationCode,
 )
 from app.core.config import settings
+from app.core.types import NormalizedEmail
 from app.core.schemas import UserSchema
 
 if TYPE_CHECKING:
@@ -21,6 +20,28 @@ if TYPE_CHECKING:
     from app.core.types import OpenAPIResponseType
 
 
+VERIFY_RESPONSES: "OpenAPIResponseType" = {
+    status.HTTP_400_BAD_REQUEST: {
+        "model": ErrorModel,
+        "content": {
+            "application/json": {
+                "examples": {
+                    ErrorCode.VERIFY_USER_BAD_CODE: {
+                        "summary": "Bad code, not existing user or"
+                        "not the e-mail currently set for the user.",
+                        "value": {"detail": ErrorCode.VERIFY_USER_BAD_CODE},
+                    },
+                    ErrorCode.VERIFY_USER_ALREADY_VERIFIED: {
+                        "summary": "The user is already verified.",
+                        "value": {"detail": ErrorCode.VERIFY_USER_ALREADY_VERIFIED},
+                    },
+                }
+            }
+        },
+    }
+}
+
+
 def get_verify_router(get_user_manager: "UserManagerDependency"):
     """Generate a router with the user verification routes."""
 
@@ -29,27 +50,6 @@ def get_verify_router(get_user_manager: "UserManagerDependency"):
         tags=["Verification"],
     )
 
-    verify_responses: "OpenAPIResponseType" = {
-        status.HTTP_400_BAD_REQUEST: {
-            "model": ErrorModel,
-            "content": {
-                "application/json": {
-                    "examples": {
-                        ErrorCode.VERIFY_USER_BAD_CODE: {
-                            "summary": "Bad code, not existing user or"
-                            "not the e-mail currently set for the user.",
-                            "value": {"detail": ErrorCode.VERIFY_USER_BAD_CODE},
-                        },
-                        ErrorCode.VERIFY_USER_ALREADY_VERIFIED: {
-                            "summary": "The user is already verified.",
-                            "value": {"detail": ErrorCode.VERIFY_USER_ALREADY_VERIFIED},
-                        },
-                    }
-                }
-            },
-        }
-    }
-
     @router.post(
         "/request-verify-code",
         status_code=status.HTTP_202_ACCEPTED,
@@ -57,7 +57,7 @@ def get_verify_router(get_user_manager: "UserManagerDependency"):
     )
     async def request_verify_token(
         user_manager: Annotated["UserManager", Depends(get_user_manager)],
-        email: EmailStr = Body(..., embed=True),
+        email: Annotated[NormalizedEmail, Body(embed=True)],
     ):
         try:
             user = await user_manager.get_by_email(email)
@@ -75,7 +75,7 @@ def get_verify_router(get_user_manager: "UserManagerDependency"):
         "/verify",
         response_model=UserSchema,
         name="verify:verify",
-        responses=verify_responses,
+        responses=VERIFY_RESPONSES,
     )
     async def verify(
         user_manager: Annotated["UserManager", Depends(get_user_manager)],
@@ -40,6 +40,14 @@ class Settings(BaseSettings):
 
     AUTH: Authentication = Authentication()
 
+    @model_validator(mode="after")
+    def _normalize_cors_origins(self) -> Self:
+        # Done once here, the CORS middleware gets origins it can compare as is.
+        if isinstance(self.CORS_ORIGINS, list):
+            self.CORS_ORIGINS = [str(origin).strip("/") for origin in self.CORS_ORIGINS]
+
+        return self
+
     @model_validator(mode="after")
     def _enforce_non_default_secrets(self) -> Self:
         self._check_default_secret("SECRET_KEY", self.SECRET_KEY)
@@ -1,7 +1,11 @@
-from pydantic import BaseModel, computed_field
+from functools import cached_property
+
+from pydantic import BaseModel, ConfigDict, computed_field
 
 
 class VersionOne(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     PREFIX: str = "/v1"
 
     REGISTER_EP: str = "/register"
@@ -12,12 +16,14 @@ class VersionOne(BaseModel):
 
 
 class Api(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     PREFIX: str = "/api"
 
     V1: VersionOne = VersionOne()
 
     @computed_field
-    @property
+    @cached_property
     def BEARER_TOKEN_URL(self) -> str:
         parts = (self.PREFIX, self.V1.PREFIX, self.V1.AUTH_EP, "/login")
         path = "".join(parts)
@@ -1,12 +1,16 @@
+from functools import cached_property
 from pathlib import Path
+from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 BASE_DIR = Path(__file__).parent.parent.parent
 
 
 class JsonWebToken(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     BACKEND_NAME: str = "jwt_bearer"
 
     PRIVATE_KEY: Path = BASE_DIR / "certs" / "jwt-private.pem"
@@ -17,11 +21,46 @@ class JsonWebToken(BaseModel):
 
     TOKEN_AUDIENCE: str = "backend:authentication"
     ALGORITHM: str = "RS256"
+    # Module implementing the JWT encoding, e.g. a compatible Rust-backed drop-in.
+    LIBRARY: str = "jwt"
+    MAX_TOKEN_LENGTH: int = 8192
+
+    DECODE_CACHE_MAXSIZE: int = 10_000
+    DECODE_CACHE_TTL_SECONDS: int = 60
+
+    # Number of processes signing tokens, defaults to the number of CPUs.
+    SIGNING_WORKERS: Optional[int] = None
+
+    @cached_property
+    def PRIVATE_KEY_BYTES(self) -> bytes:
+        return self.PRIVATE_KEY.read_bytes()
+
+    @cached_property
+    def PUBLIC_KEY_BYTES(self) -> bytes:
+        return self.PUBLIC_KEY.read_bytes()
+
+
+class PasswordHashing(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    # The cost of the stored hashes, i.e. the argon2-cffi defaults: 64 MiB of memory,
+    # 3 iterations, 4 lanes, above the OWASP minimum of 46 MiB, 1 iteration, 1 lane.
+    # Hashes with other parameters are rehashed on login, so lowering these
+    # silently downgrades the stored hashes.
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536
+    ARGON2_PARALLELISM: int = 4
+
+    # Number of passwords hashed concurrently, defaults to the number of CPUs.
+    HASHING_WORKERS: Optional[int] = None
 
 
 class Authentication(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     TOKEN_TYPE: str = "token_type"
     ACCESS_TOKEN: str = "access_token"
     REFRESH_TOKEN: str = "refresh_token"
 
     JWT: JsonWebToken = JsonWebToken()
+    PASSWORD: PasswordHashing = PasswordHashing()
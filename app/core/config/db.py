@@ -1,17 +1,27 @@
+from functools import cached_property
+
 from pydantic import (
     PostgresDsn,
     computed_field,
     BaseModel,
+    ConfigDict,
 )
 
 
 class Database(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     USER: str
     PASSWORD: str
     HOST: str
     PORT: int
     NAME: str
 
+    POOL_SIZE: int = 20
+    MAX_OVERFLOW: int = 10
+    POOL_RECYCLE: int = 1800
+    POOL_PRE_PING: bool = True
+
     DB_NAMING_CONVENTION: dict[str, str] = {
         "ix": "ix_%(column_0_label)s",
         "uq": "uq_%(table_name)s_%(column_0_N_name)s",
@@ -21,7 +31,7 @@ class Database(BaseModel):
     }
 
     @computed_field
-    @property
+    @cached_property
     def SQLALCHEMY_DATABASE_URI(self) -> str:
         return str(
             PostgresDsn.build(
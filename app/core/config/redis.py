@@ -1,7 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Redis(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     HOST: str
     PORT: int
     TOKEN_BLACKLIST_DB: list[int] = [0]
@@ -1,3 +1,6 @@
-__all__ = ("adapter",)
+__all__ = (
+    "adapter",
+    "get_adapter",
+)
 
-from .main import adapter
+from .main import adapter, get_adapter
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, AsyncGenerator, TYPE_CHECKING
 
 from sqlalchemy.ext.asyncio import (
@@ -41,9 +42,21 @@ class DatabaseAdapter:
             yield session
 
 
-adapter = DatabaseAdapter(
-    database_url=settings.DATABASE.SQLALCHEMY_DATABASE_URI,
-    kwargs={
-        "echo": True if settings.ENVIRONMENT != "local" else False,
-    },
-)
+@lru_cache(maxsize=1)
+def get_adapter() -> DatabaseAdapter:
+    """
+    Build the database adapter once, later calls share its engine and pool.
+    """
+    return DatabaseAdapter(
+        database_url=settings.DATABASE.SQLALCHEMY_DATABASE_URI,
+        kwargs={
+            "echo": settings.ENVIRONMENT == "local",
+            "pool_size": settings.DATABASE.POOL_SIZE,
+            "max_overflow": settings.DATABASE.MAX_OVERFLOW,
+            "pool_recycle": settings.DATABASE.POOL_RECYCLE,
+            "pool_pre_ping": settings.DATABASE.POOL_PRE_PING,
+        },
+    )
+
+
+adapter = get_adapter()
@@ -0,0 +1,83 @@
+import asyncio
+
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.core.db.redis.client import RedisClient
+
+
+class KeyExistsBatcher:
+    """
+    Coalesces concurrent key existence checks into pipelined requests.
+
+    Keys requested while a batch is pending are queued and checked together
+    once `delay` seconds have passed or `max_batch_size` keys are queued,
+    so N concurrent lookups cost one round trip instead of N.
+
+    :param client: The Redis client to check the keys with.
+    :param db_idx: The db index to look the keys up in.
+    :param delay: How long, in seconds, a batch waits for more keys.
+    :param max_batch_size: Number of queued keys that flushes a batch right away.
+    """
+
+    def __init__(
+        self,
+        client: "RedisClient",
+        db_idx: int = 0,
+        delay: float = 0.001,
+        max_batch_size: int = 100,
+    ):
+        self._client = client
+        self._db_idx = db_idx
+        self._delay = delay
+        self._max_batch_size = max_batch_size
+
+        self._pending: dict[str, asyncio.Future[bool]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def exists(self, key: str) -> bool:
+        """
+        Check whether the key exists, batching the check with concurrent ones.
+
+        :param key: The key to check.
+        :return: True if the key exists, False otherwise.
+        """
+        future = self._pending.get(key)
+
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[key] = loop.create_future()
+
+            if len(self._pending) >= self._max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self._delay, self._flush)
+
+        # The future is shared by every caller waiting for the same key,
+        # a cancelled caller must not cancel it for the others.
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, {}
+
+        task = asyncio.get_running_loop().create_task(self._execute(batch))
+        # Keep a reference to the task so that it is not garbage collected.
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _execute(self, batch: dict[str, asyncio.Future[bool]]) -> None:
+        try:
+            results = await self._client.has_keys(list(batch), self._db_idx)
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for future, result in zip(batch.values(), results):
+                if not future.done():
+                    future.set_result(result)
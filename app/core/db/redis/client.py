@@ -20,6 +20,7 @@ class RedisClient:
     ):
         self._servers = servers
         self._pools = {}
+        self._clients: dict[int, Redis] = {}
 
         if isinstance(pool_class, str):
             pool_class = import_string(pool_class)
@@ -27,6 +28,9 @@ class RedisClient:
 
         self._serializer = RedisSerializer()
         self._pool_options = {**options}
+        # Bound the pool, callers wait for a free connection instead of opening more.
+        self._pool_options.setdefault("max_connections", 50)
+        self._pool_options.setdefault("timeout", 20)
 
     def _get_connection_pool(self, db_idx: int = 0) -> "ConnectionPool":
         if db_idx not in self._servers:
@@ -46,8 +50,17 @@ class RedisClient:
         during initialization in the "servers" parameter.
         :return: An asynchronous Redis instance.
         """
-        pool = self._get_connection_pool(db_idx)
-        return Redis(connection_pool=pool)
+        # The client only wraps the pool, build it once per database.
+        if db_idx not in self._clients:
+            pool = self._get_connection_pool(db_idx)
+            self._clients[db_idx] = Redis(connection_pool=pool)
+
+        return self._clients[db_idx]
+
+    async def ping(self, db_idx: int = 0) -> bool:
+        client = self.get_client(db_idx=db_idx)
+
+        return bool(await client.ping())
 
     async def get(self, key: str, default: str | int, db_idx: int = 0) -> Any:
         client = self.get_client(db_idx=db_idx)
@@ -74,6 +87,24 @@ class RedisClient:
             name=key, value=value, ex=ex, px=px, nx=nx, xx=xx, keepttl=keepttl, get=get
         )
 
+    async def set_many(
+        self,
+        items: list[tuple[str, Any, Optional[int]]],
+        db_idx: int = 0,
+    ) -> None:
+        """
+        Set several keys in a single round trip.
+
+        :param items: (key, value, ex) tuples to set.
+        :param db_idx: The db index to store the keys in.
+        """
+        client = self.get_client(db_idx=db_idx)
+
+        async with client.pipeline(transaction=False) as pipe:
+            for key, value, ex in items:
+                pipe.set(name=key, value=self._serializer.dumps(value), ex=ex)
+            await pipe.execute()
+
     async def touch(self, key: str, ex: Optional[int] = None, db_idx: int = 0):
         client = self.get_client(db_idx=db_idx)
 
@@ -92,6 +123,23 @@ class RedisClient:
 
         return bool(await client.exists(key))
 
+    async def has_keys(self, keys: list[str], db_idx: int = 0) -> list[bool]:
+        """
+        Check the existence of several keys in a single round trip.
+
+        :param keys: The keys to check.
+        :param db_idx: The db index to look the keys up in.
+        :return: Whether each key exists, in the order of the given keys.
+        """
+        client = self.get_client(db_idx=db_idx)
+
+        async with client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.exists(key)
+            results = await pipe.execute()
+
+        return [bool(result) for result in results]
+
     async def clear(self, db_idx: int = 0) -> bool:
         client = self.get_client(db_idx=db_idx)
 
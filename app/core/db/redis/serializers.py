@@ -1,17 +1,53 @@
 import pickle
 
+import orjson
+
+
+INT_TAG = b"i"
+JSON_TAG = b"j"
+PICKLE_TAG = b"p"
+
+# Types orjson round-trips exactly, containers are left to pickle
+# since tuples, sets or non-str keys would not survive the trip.
+JSON_TYPES = frozenset((str, bool, type(None)))
+
 
 class RedisSerializer:
+    """
+    Serializes values stored in Redis.
+
+    Each value is prefixed with a one-byte tag telling how it was encoded,
+    so that loading it dispatches on the tag instead of probing the type.
+    """
+
+    __slots__ = ("protocol", "_json_dumps", "_json_loads")
+
     def __init__(self):
         self.protocol = pickle.HIGHEST_PROTOCOL
+        self._json_dumps = orjson.dumps
+        self._json_loads = orjson.loads
+
+    def dumps(self, obj) -> bytes:
+        obj_type = type(obj)
+
+        if obj_type is int:
+            return INT_TAG + str(obj).encode()
+        if obj_type in JSON_TYPES:
+            return JSON_TAG + self._json_dumps(obj)
+        return PICKLE_TAG + pickle.dumps(obj, self.protocol)
+
+    def loads(self, data: bytes):
+        tag = data[:1]
 
-    def dumps(self, obj):
-        if type(obj) is int:
-            return obj
-        return pickle.dumps(obj, self.protocol)
+        if tag == INT_TAG:
+            return int(data[1:])
+        if tag == JSON_TAG:
+            return self._json_loads(data[1:])
+        if tag == PICKLE_TAG:
+            return pickle.loads(data[1:])
 
-    def loads(self, data):  # noqa
-        try:
-            return int(data)
-        except ValueError:
+        # Values written before the tags were introduced: either a bare integer
+        # or a pickle, which always starts with the PROTO opcode.
+        if tag == pickle.PROTO:
             return pickle.loads(data)
+        return int(data)
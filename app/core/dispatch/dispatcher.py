@@ -1,11 +1,12 @@
 import inspect
 import weakref
 import asyncio
+import threading
 
-from typing import Callable, Optional, Any
-from asyncio import Lock
+from types import CoroutineType, MethodType
+from typing import Callable, Final, Optional, Any
 
-from app.core.utils import func_accepts_kwargs, Symbol
+from app.core.utils import func_accepts_kwargs
 from app.core.config import settings
 
 
@@ -16,14 +17,29 @@ def _make_id(target: Any) -> int | tuple[int, int]:
     :param target: The target object, which can be a method or any other callable.
     :return: A unique identifier for the target.
     """
-    if inspect.ismethod(target):
+    if type(target) is MethodType:
         return id(target.__self__), id(target.__func__)
 
     return id(target)
 
 
+def _strong_ref(receiver: Callable) -> Callable[[], Callable]:
+    """
+    Wrap the receiver in a callable returning it, like a weak reference would.
+
+    :param receiver: The receiver to keep a strong reference to.
+    :return: A callable resolving to the receiver.
+    """
+
+    def resolve() -> Callable:
+        return receiver
+
+    return resolve
+
+
 NONE_ID = _make_id(None)
-NO_RECEIVERS = Symbol("NO_RECEIVERS")
+# The receivers are only checked in development, the environment doesn't change at runtime.
+_IS_LOCAL: Final[bool] = settings.ENVIRONMENT == "local"
 
 
 class Signal:
@@ -36,17 +52,27 @@ class Signal:
         """
         Initialize the Signal instance.
 
-        :param use_caching: Optional; If True, cache the receivers for each sender.
+        :param use_caching: Optional; Kept for compatibility, the receivers are
+        always sharded by sender, so looking them up is already a single dict access.
         """
-        self.receivers: list[tuple[tuple[Any, Any], Callable]] = []
-        self.lock: Lock = Lock()
+        # Receiver resolvers keyed by their lookup key, in connection order. A resolver
+        # is either a weak reference or a closure holding the receiver.
+        self.receivers: dict[tuple[Any, Any], Callable[[], Optional[Callable]]] = {}
+        # Receivers sharded by sender key, rebuilt on every change and read by send
+        # without the lock. Each shard also holds the receivers connected to any
+        # sender, in connection order, senders without a shard use the latter alone.
+        self._any_sender_receivers: tuple[Callable, ...] = ()
+        self._sender_receivers: dict[Any, tuple[Callable, ...]] = {}
+        # Guards the receivers against other threads, the critical sections never await.
+        self.lock: threading.Lock = threading.Lock()
         self.use_caching: bool = use_caching
-        self.sender_receivers_cache: weakref.WeakKeyDictionary | dict = (
-            weakref.WeakKeyDictionary() if use_caching else {}
-        )
         self._dead_receivers: bool = False
+        # The shards resolved once by freeze, dropped on any change to the receivers.
+        self._frozen_receivers: Optional[
+            tuple[tuple[Callable, ...], dict[Any, tuple[Callable, ...]]]
+        ] = None
 
-    async def connect(
+    def connect(
         self,
         receiver: Callable,
         sender: Optional[Any] = None,
@@ -60,6 +86,8 @@ class Signal:
         receive signals. Receivers must be hashable objects.
         If weak is True, then receiver must be weak referencable.
         Receivers must be able to accept keyword arguments.
+        Receivers may be coroutine functions or plain functions, the latter
+        respond without being scheduled on the event loop.
         If a receiver is connected with a dispatch_uid argument, it
         will not be added if another receiver was already connected
         with that dispatch_uid.
@@ -75,7 +103,7 @@ class Signal:
         """
 
         # If this is a development environment:
-        if settings.ENVIRONMENT == "local":
+        if _IS_LOCAL:
             if not callable(receiver):
                 raise TypeError("Signal receivers must be callable.")
             # Check for **kwargs
@@ -94,22 +122,23 @@ class Signal:
             receiver_object = receiver
 
             # Check for bound methods
-            if inspect.ismethod(receiver):
+            if type(receiver) is MethodType:
                 ref = weakref.WeakMethod
                 receiver_object = receiver.__self__
 
-            receiver = ref(receiver)
+            resolver = ref(receiver)
             weakref.finalize(receiver_object, self._remove_receiver)
+        else:
+            resolver = _strong_ref(receiver)
 
-        async with self.lock:
+        with self.lock:
             self._clear_dead_receivers()
 
-            if not any(_lookup_key == lookup_key for _lookup_key, _ in self.receivers):
-                self.receivers.append((lookup_key, receiver))
+            if lookup_key not in self.receivers:
+                self.receivers[lookup_key] = resolver
+                self._shard_receivers()
 
-            self.sender_receivers_cache.clear()
-
-    async def disconnect(
+    def disconnect(
         self,
         receiver: Optional[Callable] = None,
         sender: Optional[Any] = None,
@@ -132,21 +161,47 @@ class Signal:
         else:
             lookup_key = (_make_id(receiver), _make_id(sender))
 
-        disconnected = False
-
-        async with self.lock:
+        with self.lock:
             self._clear_dead_receivers()
 
-            for idx, (_lookup_key, _) in enumerate(self.receivers):
-                if _lookup_key == lookup_key:
-                    disconnected = True
-                    del self.receivers[idx]
-                    break
+            disconnected = self.receivers.pop(lookup_key, None) is not None
 
-            self.sender_receivers_cache.clear()
+            if disconnected:
+                self._shard_receivers()
 
         return disconnected
 
+    def freeze(self) -> bool:
+        """
+        Resolve the receivers once, so that send no longer goes through the
+        resolvers.
+
+        Meant to be called once the receivers are connected, e.g. at startup.
+        Only signals whose receivers are all strongly referenced can be frozen,
+        as a weak receiver may be collected at any time. Connecting or
+        disconnecting a receiver unfreezes the signal.
+
+        :return: True if the signal was frozen, False otherwise.
+        """
+        with self.lock:
+            self._clear_dead_receivers()
+
+            if any(
+                isinstance(resolver, weakref.ref)
+                for resolver in self.receivers.values()
+            ):
+                return False
+
+            self._frozen_receivers = (
+                tuple(resolver() for resolver in self._any_sender_receivers),
+                {
+                    sender_key: tuple(resolver() for resolver in resolvers)
+                    for sender_key, resolvers in self._sender_receivers.items()
+                },
+            )
+
+        return True
+
     async def send(self, sender: Any, **kwargs: Any) -> list[tuple[Callable, Any]]:
         """
         Send signal from sender to all connected receivers catching errors.
@@ -158,20 +213,25 @@ class Signal:
         If any receiver raises an error (specifically any subclass of
         Exception), return the error instance as the result for that receiver.
         """
-        if (
-            not self.receivers
-            or self.sender_receivers_cache.get(sender) is NO_RECEIVERS
-        ):
-            return []
+        return await self._send(sender, kwargs, return_exceptions=True)
 
-        receivers = await self._live_receivers(sender)
+    async def send_noexc(
+        self, sender: Any, **kwargs: Any
+    ) -> list[tuple[Callable, Any]]:
+        """
+        Send signal from sender to all connected receivers, letting errors propagate.
 
-        responses = await asyncio.gather(
-            *[receiver(sender=sender, signal=self, **kwargs) for receiver in receivers],
-            return_exceptions=True
-        )
+        Cheaper than send when receivers are not expected to fail, as no error
+        is caught: the first one propagates as soon as it is raised.
 
-        return list(zip(receivers, responses))
+        :param sender: The sender of the signal. Can be any Python object (normally one
+        registered with a "connect" method if you actually want something to occur).
+        :param kwargs: Additional keyword arguments to pass to the receivers.
+        :raises Exception: The first error raised by a receiver. The receivers
+        already awaited keep running.
+        :return: A list of tuple pairs [(receiver, response), ... ].
+        """
+        return await self._send(sender, kwargs, return_exceptions=False)
 
     async def has_listeners(self, sender: Optional[Any] = None) -> bool:
         """
@@ -182,17 +242,116 @@ class Signal:
         """
         return bool(await self._live_receivers(sender))
 
+    async def _send(
+        self, sender: Any, kwargs: dict[str, Any], return_exceptions: bool
+    ) -> list[tuple[Callable, Any]]:
+        if not self.receivers:
+            return []
+
+        # Built once and unpacked as is, rather than merged again for every receiver.
+        call_kwargs = {**kwargs, "sender": sender, "signal": self}
+        frozen_receivers = self._frozen_receivers
+
+        if frozen_receivers is not None:
+            any_sender_receivers, sender_receivers = frozen_receivers
+            receivers = sender_receivers.get(_make_id(sender), any_sender_receivers)
+        else:
+            receivers = [
+                receiver
+                for resolver in self._get_resolvers(sender)
+                if (receiver := resolver()) is not None
+            ]
+
+        if not receivers:
+            return []
+
+        if not return_exceptions:
+            return await self._send_noexc(receivers, call_kwargs)
+
+        responses = []
+        # Indexes of the responses still to be awaited.
+        pending = []
+
+        # Synchronous receivers respond right away, only awaitables are awaited.
+        for receiver in receivers:
+            try:
+                response = receiver(**call_kwargs)
+            except Exception as e:
+                response = e
+            else:
+                # The exact type check spares the generic one for coroutines.
+                if type(response) is CoroutineType or inspect.isawaitable(response):
+                    pending.append(len(responses))
+
+            responses.append(response)
+
+        # A single coroutine is awaited directly, without wrapping it in a task.
+        if len(pending) == 1:
+            index = pending[0]
+            try:
+                responses[index] = await responses[index]
+            except Exception as e:
+                responses[index] = e
+        elif pending:
+            # Coroutines are wrapped in tasks, futures are used as they are.
+            tasks = [asyncio.ensure_future(responses[index]) for index in pending]
+
+            try:
+                await asyncio.wait(tasks)
+            except asyncio.CancelledError:
+                for task in tasks:
+                    task.cancel()
+                raise
+
+            # Collect every error, so that none of them is reported as never retrieved.
+            for index, task in zip(pending, tasks):
+                error = (
+                    asyncio.CancelledError() if task.cancelled() else task.exception()
+                )
+
+                responses[index] = task.result() if error is None else error
+
+        return list(zip(receivers, responses))
+
+    async def _send_noexc(
+        self, receivers: list[Callable], call_kwargs: dict[str, Any]
+    ) -> list[tuple[Callable, Any]]:
+        responses = []
+        pending = []
+
+        try:
+            for receiver in receivers:
+                response = receiver(**call_kwargs)
+                if type(response) is CoroutineType or inspect.isawaitable(response):
+                    pending.append(len(responses))
+                responses.append(response)
+        except Exception:
+            # The receivers called so far will never be awaited.
+            for index in pending:
+                if type(responses[index]) is CoroutineType:
+                    responses[index].close()
+            raise
+
+        if len(pending) == 1:
+            index = pending[0]
+            responses[index] = await responses[index]
+        elif pending:
+            # Propagates the first error, the others are retrieved by gather.
+            results = await asyncio.gather(*[responses[index] for index in pending])
+            for index, result in zip(pending, results):
+                responses[index] = result
+
+        return list(zip(receivers, responses))
+
     def _clear_dead_receivers(self):
         # Note: caller is assumed to hold self.lock.
         if self._dead_receivers:
-            self.receivers = [
-                receiver
-                for receiver in self.receivers
-                if not (
-                    isinstance(receiver[1], weakref.ReferenceType)
-                    and receiver[1]() is None
-                )
-            ]
+            self.receivers = {
+                lookup_key: resolver
+                for lookup_key, resolver in self.receivers.items()
+                if resolver() is not None
+            }
+            self._shard_receivers()
             self._dead_receivers = False
 
     async def _live_receivers(self, sender: Optional[Any]) -> list[Callable]:
@@ -205,44 +364,51 @@ class Signal:
         :param sender: The sender to retrieve receivers for.
         :return: A list of callable receivers.
         """
-        receivers = None
+        # Every receiver is stored as a resolver, dead weak references resolve to None.
+        return [
+            receiver
+            for resolver in self._get_resolvers(sender)
+            if (receiver := resolver()) is not None
+        ]
+
+    def _get_resolvers(self, sender: Optional[Any]) -> tuple[Callable, ...]:
+        """
+        Get the resolvers of the receivers connected to the sender.
 
-        if self.use_caching and not self._dead_receivers:
-            receivers = self.sender_receivers_cache.get(sender)
-            # We could end up here with NO_RECEIVERS even if we do check this case in
-            # .send() prior to calling _live_receivers() due to concurrent .send() call.
-            if receivers is NO_RECEIVERS:
-                return []
+        :param sender: The sender to retrieve receivers for.
+        :return: The resolvers, in connection order.
+        """
+        sender_key = _make_id(sender)
 
-        if receivers is None:
-            async with self.lock:
+        if self._dead_receivers:
+            with self.lock:
                 self._clear_dead_receivers()
 
-                sender_key = _make_id(sender)
-                receivers = []
-
-                for (_, _sender_key), receiver in self.receivers:
-                    if _sender_key == NONE_ID or _sender_key == sender_key:
-                        receivers.append(receiver)
-
-                if self.use_caching:
-                    if not receivers:
-                        self.sender_receivers_cache[sender] = NO_RECEIVERS
-                    else:
-                        self.sender_receivers_cache[sender] = receivers
-
-        non_weak_receivers = []
+        return self._sender_receivers.get(sender_key, self._any_sender_receivers)
 
-        for receiver in receivers:
-            if isinstance(receiver, weakref.ReferenceType):
-                # Dereference the weak reference.
-                receiver = receiver()
-                if receiver is not None:
-                    non_weak_receivers.append(receiver)
+    def _shard_receivers(self):
+        # Note: caller is assumed to hold self.lock.
+        sender_keys = {
+            sender_key for _, sender_key in self.receivers if sender_key != NONE_ID
+        }
+        any_sender_receivers = []
+        sender_receivers = {sender_key: [] for sender_key in sender_keys}
+
+        for (_, sender_key), receiver in self.receivers.items():
+            if sender_key == NONE_ID:
+                any_sender_receivers.append(receiver)
+                for receivers in sender_receivers.values():
+                    receivers.append(receiver)
             else:
-                non_weak_receivers.append(receiver)
-
-        return non_weak_receivers
+                sender_receivers[sender_key].append(receiver)
+
+        self._any_sender_receivers = tuple(any_sender_receivers)
+        self._sender_receivers = {
+            sender_key: tuple(receivers)
+            for sender_key, receivers in sender_receivers.items()
+        }
+        # Unfreezes the signal.
+        self._frozen_receivers = None
 
     def _remove_receiver(self):
         self._dead_receivers = True
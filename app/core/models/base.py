@@ -14,4 +14,11 @@ class Base(DeclarativeBase):
 
     @declared_attr.directive
     def __tablename__(cls) -> str:
-        return f"{camel_case_to_snake_case(cls.__name__)}s"
+        # Stored on the class itself, a subclass computes its own name.
+        tablename = cls.__dict__.get("_cached_tablename")
+
+        if tablename is None:
+            tablename = f"{camel_case_to_snake_case(cls.__name__)}s"
+            cls._cached_tablename = tablename
+
+        return tablename
@@ -1,6 +1,6 @@
 from .base import Base
 
-from sqlalchemy import String, Boolean
+from sqlalchemy import String, Boolean, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -42,3 +42,7 @@ class User(Base):
     @property
     def full_name(self):
         return f"{self.first_name} {self.last_name}"
+
+
+# Case-insensitive e-mail lookups compare against lower(email).
+Index("ix_users_email_lower", func.lower(User.email))
@@ -1,18 +1,24 @@
-from typing import Optional
+from typing import ClassVar, Optional
 
-from pydantic import BaseModel, ConfigDict, EmailStr
+from pydantic import BaseModel, ConfigDict
+
+from app.core.types import Email, NormalizedEmail
 
 
 class CreateUpdateDictSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    # Fields only a superuser can set.
+    SUPERUSER_FIELDS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "is_superuser",
+            "is_active",
+            "is_verified",
+        }
+    )
+
     def create_update_dict(self):
-        return self.model_dump(
-            exclude_unset=True,
-            exclude={
-                "is_superuser",
-                "is_active",
-                "is_verified",
-            },
-        )
+        return self.model_dump(exclude_unset=True, exclude=self.SUPERUSER_FIELDS)
 
     def create_update_dict_superuser(self):
         return self.model_dump(exclude_unset=True)
@@ -22,18 +28,16 @@ class UserSchema(CreateUpdateDictSchema):
     """User Schema."""
 
     id: int
-    email: EmailStr
+    email: Email
     first_name: str
     last_name: str
     is_active: bool = True
     is_superuser: bool = False
     is_verified: bool = False
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class UserCreateSchema(CreateUpdateDictSchema):
-    email: EmailStr
+    email: NormalizedEmail
     password: str
     first_name: str
     last_name: str
@@ -43,7 +47,7 @@ class UserCreateSchema(CreateUpdateDictSchema):
 
 
 class UserUpdateSchema(CreateUpdateDictSchema):
-    email: Optional[EmailStr] = None
+    email: Optional[NormalizedEmail] = None
     password: Optional[str] = None
     first_name: Optional[str] = None
     last_name: Optional[str] = None
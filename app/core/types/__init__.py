@@ -1,5 +1,6 @@
-__all__ = ["DependencyCallable", "OpenAPIResponseType"]
+__all__ = ["DependencyCallable", "Email", "NormalizedEmail", "OpenAPIResponseType"]
 
 
 from .dependency_callable import DependencyCallable
+from .email import Email, NormalizedEmail
 from .openapi_response import OpenAPIResponseType
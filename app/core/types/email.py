@@ -0,0 +1,20 @@
+from typing import Annotated
+
+from pydantic import StringConstraints, WithJsonSchema
+
+
+# A lightweight replacement for EmailStr: the address is only checked to have
+# the user@domain.tld shape, and is normalized to lowercase without surrounding spaces.
+NormalizedEmail = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        to_lower=True,
+        max_length=320,
+        pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$",
+    ),
+    WithJsonSchema({"type": "string", "format": "email", "maxLength": 320}),
+]
+
+# E-mails read back from the database, output as they were stored.
+Email = Annotated[str, WithJsonSchema({"type": "string", "format": "email"})]
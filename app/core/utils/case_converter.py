@@ -1,3 +1,11 @@
+import re
+
+
+# An underscore goes before an uppercase letter that follows a non-uppercase
+# character, or that starts a new word after an acronym ("HTTPServer").
+CAMEL_CASE_BOUNDARY = re.compile(r"(?<=[^A-Z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][^A-Z])")
+
+
 def camel_case_to_snake_case(input_string: str) -> str:
     """
     Converts camelCase to snake_case
@@ -7,18 +15,4 @@ def camel_case_to_snake_case(input_string: str) -> str:
     >>> camel_case_to_snake_case('ObiWanKenobi')
     "obi_wan_kenobi"
     """
-    characters = []
-
-    for curr_idx, char in enumerate(input_string):
-        if curr_idx and char.isupper():
-            next_idx = curr_idx + 1
-            flag = next_idx >= len(input_string) or input_string[next_idx].isupper()
-            prev_char = input_string[curr_idx - 1]
-
-            if prev_char.isupper() and flag:
-                pass
-            else:
-                characters.append("_")
-        characters.append(char.lower())
-
-    return "".join(characters)
+    return CAMEL_CASE_BOUNDARY.sub("_", input_string).lower()
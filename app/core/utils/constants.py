@@ -13,16 +13,17 @@ class Symbol:
 
     symbols: ClassVar[dict[str, "Symbol"]] = {}
 
+    name: str
+
     def __new__(cls, name: str) -> "Symbol":
-        if name in cls.symbols:
-            return cls.symbols[name]
+        obj = cls.symbols.get(name)
+        if obj is not None:
+            return obj
 
         obj = super().__new__(cls)
-        cls.symbols[name] = obj
-        return obj
-
-    def __init__(self, name: str) -> None:
-        self.name = name
+        obj.name = name
+        # setdefault keeps the first instance if another thread created it meanwhile.
+        return cls.symbols.setdefault(name, obj)
 
     def __repr__(self) -> str:
         return self.name
@@ -1,5 +1,7 @@
 import inspect
 
+from types import MethodType
+
 
 def _get_func_parameters(func, remove_first):
     parameters = tuple(inspect.signature(func).parameters.values())
@@ -9,7 +11,7 @@ def _get_func_parameters(func, remove_first):
 
 
 def _get_callable_parameters(meth_or_func):
-    is_method = inspect.ismethod(meth_or_func)
+    is_method = type(meth_or_func) is MethodType
     func = meth_or_func.__func__ if is_method else meth_or_func
     return _get_func_parameters(func, remove_first=is_method)
 
@@ -0,0 +1,109 @@
+"""
+Token signing run in the worker processes of the JWT strategy.
+
+The workers only import this module, so it must not import anything from the
+application but the standard library, jwt, cryptography and orjson.
+"""
+
+import json
+import time
+import importlib
+import orjson
+
+from functools import lru_cache
+from typing import Any, Optional, TYPE_CHECKING
+
+from jwt import PyJWT, DecodeError
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
+
+
+class ORJSONPyJWT(PyJWT):
+    """
+    PyJWT serializing and parsing the payload with orjson instead of json.
+    """
+
+    def _encode_payload(
+        self,
+        payload: dict[str, Any],
+        headers: Optional[dict[str, Any]] = None,
+        json_encoder: Optional[type[json.JSONEncoder]] = None,
+    ) -> bytes:
+        if json_encoder is not None:
+            return super()._encode_payload(payload, headers, json_encoder)
+
+        return orjson.dumps(payload)
+
+    def _decode_payload(self, decoded: dict[str, Any]) -> Any:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise DecodeError(f"Invalid payload string: {e}")
+        if not isinstance(payload, dict):
+            raise DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+@lru_cache(maxsize=None)
+def get_jwt_api(library: str) -> Any:
+    """
+    Return the object encoding and decoding the tokens with the given library.
+
+    Any module exposing PyJWT's encode/decode API and exceptions can be used,
+    PyJWT itself is replaced with ORJSONPyJWT, other libraries are used as they are.
+    """
+    jwt = importlib.import_module(library)
+    return ORJSONPyJWT() if jwt.__name__ == "jwt" else jwt
+
+
+def generate_jwt(
+    data: dict[str, Any],
+    private_key: "str | PrivateKeyTypes",
+    audience: str,
+    lifetime_seconds: int,
+    algorithm: str,
+    library: str = "jwt",
+) -> str:
+    payload = data.copy()
+
+    # A NumericDate, PyJWT would convert a datetime to it anyway.
+    payload["exp"] = int(time.time()) + lifetime_seconds
+    payload["aud"] = audience
+
+    return get_jwt_api(library).encode(
+        payload=payload, key=private_key, algorithm=algorithm
+    )
+
+
+@lru_cache(maxsize=8)
+def load_private_key(private_key_pem: bytes) -> "PrivateKeyTypes":
+    """
+    Parse a PEM encoded private key, the result is cached.
+
+    PyJWT accepts the parsed key, passing it avoids parsing the PEM on every call.
+    """
+    return load_pem_private_key(private_key_pem, password=None)
+
+
+def generate_jwt_from_pem(
+    data: dict[str, Any],
+    private_key_pem: bytes,
+    audience: str,
+    lifetime_seconds: int,
+    algorithm: str,
+    library: str = "jwt",
+) -> str:
+    """
+    Same as `generate_jwt`, but takes the PEM encoded private key so that it can be
+    called in a worker process. The key is parsed once per process.
+    """
+    return generate_jwt(
+        data=data,
+        private_key=load_private_key(private_key_pem),
+        audience=audience,
+        lifetime_seconds=lifetime_seconds,
+        algorithm=algorithm,
+        library=library,
+    )
@@ -2,8 +2,10 @@ from typing import Any
 
 
 def parse_cors(value: Any) -> list[str] | str:
-    if isinstance(value, str) and not value.startswith("["):
-        return [i.strip() for i in value.split(",")]
-    elif isinstance(value, list | str):
+    if isinstance(value, list):
         return value
+    elif isinstance(value, str):
+        if value.startswith("["):
+            return value
+        return list(map(str.strip, value.split(",")))
     raise ValueError(value)
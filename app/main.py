@@ -12,8 +12,11 @@ from app.core.config import settings
 
 
 @asynccontextmanager
-async def lifespan(_: FastAPI):
+async def lifespan(app_: FastAPI):
     await on_startup()
+    # FastAPI memoizes the schema on the app, build it now
+    # instead of on the first request to the docs.
+    app_.openapi()
     yield
     # shutdown
     await on_shutdown()
@@ -28,7 +31,7 @@ app = FastAPI(
 if settings.CORS_ORIGINS:
     app.add_middleware(
         CORSMiddleware,  # noqa
-        allow_origins=[str(origin).strip("/") for origin in settings.CORS_ORIGINS],
+        allow_origins=settings.CORS_ORIGINS,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],